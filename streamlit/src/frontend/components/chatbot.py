@@ -11,6 +11,7 @@ from .chatbot_lib import (
     MCP_SYSTEM_PROMPT,
     WAVES_PATH,
     _create_azure_client,
+    _create_async_azure_client,
     _initialize_chat_state,
     _append_message,
     _extract_text_from_upload,
@@ -27,6 +28,7 @@ __all__ = [
     "MCP_SYSTEM_PROMPT",
     "WAVES_PATH",
     "_create_azure_client",
+    "_create_async_azure_client",
     "_initialize_chat_state",
     "_append_message",
     "_extract_text_from_upload",
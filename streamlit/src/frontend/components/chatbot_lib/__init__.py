@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from .azure_client import create_azure_client as _create_azure_client
+from .azure_client import (
+    create_azure_client as _create_azure_client,
+    create_async_azure_client as _create_async_azure_client,
+)
 from .chat_state import (
     initialize_chat_state as _initialize_chat_state,
     append_message as _append_message,
@@ -20,6 +23,7 @@ from .constants import AZURE_DEPLOYMENT_ENV, MCP_SYSTEM_PROMPT, WAVES_PATH
 
 __all__ = [
     "_create_azure_client",
+    "_create_async_azure_client",
     "_initialize_chat_state",
     "_append_message",
     "_extract_text_from_upload",
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import importlib.util
-from typing import Optional
+from typing import Any, Awaitable, Optional, TypeVar
 
 from .constants import get_azure_endpoint
 
 openai_spec = importlib.util.find_spec("openai")
 if openai_spec is not None:  # pragma: no cover - imported at runtime when available
-    from openai import APIStatusError, AzureOpenAI  # type: ignore[import]
+    from openai import APIStatusError, AsyncAzureOpenAI, AzureOpenAI  # type: ignore[import]
 else:  # pragma: no cover - dependency optional for linting
     APIStatusError = Exception  # type: ignore[misc]
     AzureOpenAI = None  # type: ignore[assignment]
+    AsyncAzureOpenAI = None  # type: ignore[assignment]
 
 
 def create_azure_client() -> Optional[AzureOpenAI]:
@@ -22,3 +23,28 @@ def create_azure_client() -> Optional[AzureOpenAI]:
     return AzureOpenAI(
         azure_endpoint=endpoint, api_key=api_key, api_version=api_version
     )
+
+
+def create_async_azure_client() -> Optional[AsyncAzureOpenAI]:
+    # Not pooled across reruns: the async connection pool is bound to the event
+    # loop that ``asyncio.run`` closes at the end of each conversation, so
+    # callers release it with ``close_after``.
+    endpoint, api_key, api_version = get_azure_endpoint()
+
+    if not endpoint or not api_key or AsyncAzureOpenAI is None:
+        return None
+
+    return AsyncAzureOpenAI(
+        azure_endpoint=endpoint, api_key=api_key, api_version=api_version
+    )
+
+
+_T = TypeVar("_T")
+
+
+async def close_after(client: Any, awaitable: Awaitable[_T]) -> _T:
+    """Await ``awaitable`` then close ``client``'s loop-bound connection pool."""
+    try:
+        return await awaitable
+    finally:
+        await client.close()
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import streamlit as st
 
-from .constants import MCP_SYSTEM_PROMPT
+from .constants import SYSTEM_MSG
 
 
 def initialize_chat_state() -> None:
@@ -20,7 +20,7 @@ def initialize_chat_state() -> None:
 
     msgs = st.session_state.messages
     if not msgs or msgs[0].get("role") != "system":
-        msgs.insert(0, {"role": "system", "content": MCP_SYSTEM_PROMPT})
+        msgs.insert(0, dict(SYSTEM_MSG))
 
 
 def append_message(role: str, content: str) -> None:
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from types import MappingProxyType
+
+from ..mcp_lib.constants import ROLE_NAMES
 
 COMPONENTS_DIR = Path(__file__).resolve().parents[1]
 WAVES_PATH = COMPONENTS_DIR / "lottie_files" / "Waves.json"
 AZURE_DEPLOYMENT_ENV = "AZURE_OPENAI_CHAT_DEPLOYMENT"
+ASSIGNABLE_ROLES = frozenset(ROLE_NAMES)
 
 MCP_SYSTEM_PROMPT = (
     "You are Sniffer Bank's fully agentic lending copilot. Every conversation follows Borrower or Lender tracks. "
@@ -14,6 +18,9 @@ MCP_SYSTEM_PROMPT = (
     "CRITICAL AUTOPILOT MODE:\n"
     "- When ANY tool returns `pending: true`, IMMEDIATELY call `getConnectedWallet` to poll for completion.\n"
     "- Keep calling `getConnectedWallet` in a loop until you get a `txHash` or error.\n"
+    "- When a LendingPool write (deposit, withdraw, repay, checkDefaultAndBan, unban) returns `status: \"pending\"` with a `txHash`, "
+    "it was only broadcast. Call `txStatus(tx_hash=...)` until it returns a `receipt` or an error before telling the user it is done; "
+    "report reverts and their reason.\n"
     "- TIMEOUT HANDLING:\n"
     "  * If `getConnectedWallet` returns `transaction_timeout: true`, the transaction expired\n"
     "  * Tell user: 'The transaction request timed out. Let me retry for you.'\n"
@@ -74,7 +81,8 @@ MCP_SYSTEM_PROMPT = (
     "   - ONLY after confirming ARC network, call `repay`\n"
     "   - Repayment uses native ARC tokens, not USDC\n"
     "   - NEVER attempt repayment on Polygon - it will fail\n"
-"16. For all transactions: tool returns `pending: true` → auto-poll `getConnectedWallet` until `txHash`\n"
+"16. For all transactions: tool returns `pending: true` → auto-poll `getConnectedWallet` until `txHash`; "
+    "tool returns `status: \"pending\"` with a `txHash` → poll `txStatus` until `receipt` or error\n"
     "\n"
     "CCTP TRANSFERS (NON-LOAN OPERATIONS):\n"
     "- `startArcPolygonBridge`, `resumeArcPolygonBridge`, and `preparePolygonMint` move LendingPool USDC but DO NOT record borrower loans.\n"
@@ -95,6 +103,9 @@ MCP_SYSTEM_PROMPT = (
     "Always auto-poll. Be concise. User only approves MetaMask. ARC network is mandatory for all operations."
 )
 
+# Read-only template; copy with ``dict(SYSTEM_MSG)`` before storing in history.
+SYSTEM_MSG = MappingProxyType({"role": "system", "content": MCP_SYSTEM_PROMPT})
+
 
 def get_azure_endpoint() -> tuple[str | None, str | None, str | None]:
     endpoint = os.getenv("AZURE_OPENAI_ENDPOINT")
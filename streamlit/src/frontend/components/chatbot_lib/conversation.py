@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Callable, Dict, Iterable, Optional
 
+import orjson
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 
-from ..toolkit import render_tool_message, tool_error, tool_success
+from ..mcp_lib.constants import READ_ONLY_TOOLS
+from ..toolkit import render_tool_messages, tool_error, tool_success
+from ..toolkit_lib.messages import _dumps
+from .azure_client import AsyncAzureOpenAI
 
 
 logger = logging.getLogger("arc.mcp.tools")
@@ -18,6 +26,14 @@ if not logger.handlers:
 logger.setLevel(logging.INFO)
 logger.propagate = False
 
+# Shared pool for network-bound tool handlers (web3 RPC, HTTP) and for the
+# blocking completion call when a synchronous client is supplied.
+_TOOL_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="mcp-tool")
+
+# Rough request budget (~4 chars per token) for the history sent to Azure.
+# The full history stays in ``messages``; only the outgoing payload is trimmed.
+_HISTORY_CHAR_BUDGET = 24_000
+
 
 def _truncate_output(value: str, limit: int = 800) -> str:
     if not value:
@@ -36,16 +52,158 @@ def stream_chunks(stream: Iterable) -> Iterable[str]:
             yield delta
 
 
+def _message_size(message: Dict[str, Any]) -> int:
+    size = len(message.get("content") or "")
+    for tool_call in message.get("tool_calls") or ():
+        function = tool_call.get("function") or {}
+        size += len(function.get("arguments") or "")
+    return size
+
+
+def _trim_messages(
+    messages: list[Dict[str, Any]], max_chars: int = _HISTORY_CHAR_BUDGET
+) -> list[Dict[str, Any]]:
+    """Keep leading system prompts plus the most recent turns within ``max_chars``.
+
+    Cuts only happen at user messages so assistant tool calls are never
+    separated from their tool results. The newest turn is always kept.
+    """
+
+    head = 0
+    while head < len(messages) and messages[head].get("role") == "system":
+        head += 1
+
+    used = 0
+    cut = None
+    for index in range(len(messages) - 1, head - 1, -1):
+        used += _message_size(messages[index])
+        if messages[index].get("role") != "user":
+            continue
+        if used > max_chars and cut is not None:
+            break
+        cut = index
+
+    if cut is None or cut == head:
+        return messages
+    omitted = cut - head
+    logger.info("Trimmed %d earlier messages from the completion request.", omitted)
+    return [
+        *messages[:head],
+        {
+            "role": "system",
+            "content": f"({omitted} earlier conversation messages omitted for brevity.)",
+        },
+        *messages[cut:],
+    ]
+
+
 def _parse_tool_output(content: Any) -> Any:
     if isinstance(content, str):
         try:
-            return json.loads(content)
-        except json.JSONDecodeError:
+            return orjson.loads(content)
+        except orjson.JSONDecodeError:
             return None
     return content
 
 
-def run_mcp_llm_conversation(
+def _invoke_tool(
+    tool_call: Any,
+    function_map: Dict[str, Any],
+    script_ctx: Any = None,
+) -> str:
+    """Run a single tool handler; executed on a worker thread."""
+
+    if script_ctx is not None:
+        # Handlers read ``st.session_state``; attach the caller's script context.
+        add_script_run_ctx(threading.current_thread(), script_ctx)
+
+    tool_name = tool_call.function.name
+    args_payload = tool_call.function.arguments
+    try:
+        arguments = (
+            orjson.loads(args_payload) if args_payload and args_payload != "{}" else {}
+        )
+    except orjson.JSONDecodeError:
+        arguments = {}
+
+    logger.info("Tool call '%s' invoked with args: %s", tool_name, arguments)
+
+    handler = function_map.get(tool_name)
+    if handler is None:
+        logger.warning("Tool '%s' is not registered.", tool_name)
+        return tool_error(f"Tool '{tool_name}' is not registered.")
+
+    try:
+        logger.info("Tool '%s' executing...", tool_name)
+        response_payload = handler(**arguments)
+        return (
+            response_payload
+            if isinstance(response_payload, str)
+            else tool_success(response_payload)
+        )
+    except Exception as exc:  # pragma: no cover - surfaced via UI only
+        logger.exception("Tool '%s' raised an exception: %s", tool_name, exc)
+        return tool_error(str(exc))
+
+
+async def _dispatch_tool_calls(
+    tool_calls: list[Any], function_map: Dict[str, Any], script_ctx: Any
+) -> list[str]:
+    """Run one round of tool calls, returning outputs in call order.
+
+    Consecutive read-only calls run concurrently on the tool pool. Anything
+    else may change state (approve then deposit, issueScore then openLoan),
+    so it runs alone, in the order the model emitted it.
+    """
+
+    loop = asyncio.get_running_loop()
+
+    def submit(tool_call: Any) -> "asyncio.Future[str]":
+        return loop.run_in_executor(
+            _TOOL_POOL, _invoke_tool, tool_call, function_map, script_ctx
+        )
+
+    outputs: list[str] = []
+    reads: list[Any] = []
+    for tool_call in tool_calls:
+        if tool_call.function.name in READ_ONLY_TOOLS:
+            reads.append(tool_call)
+            continue
+        if reads:
+            outputs.extend(await asyncio.gather(*map(submit, reads)))
+            reads = []
+        outputs.append(await submit(tool_call))
+    if reads:
+        outputs.extend(await asyncio.gather(*map(submit, reads)))
+    return outputs
+
+
+async def _create_completion(client: Any, **kwargs: Any) -> Any:
+    if AsyncAzureOpenAI is not None and isinstance(client, AsyncAzureOpenAI):
+        return await client.chat.completions.create(**kwargs)
+    # Synchronous ``AzureOpenAI`` fallback: keep the event loop free.
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _TOOL_POOL, partial(client.chat.completions.create, **kwargs)
+    )
+
+
+def _notify_status(
+    status_callback: Optional[Callable[[Any], None]], event: Dict[str, Any]
+) -> None:
+    if not status_callback:
+        return
+    try:
+        status_callback(event)
+    except Exception:
+        logger.exception(
+            "Status callback raised an error during '%s' for '%s'",
+            event.get("phase"),
+            event.get("tool"),
+        )
+
+
+async def run_mcp_llm_conversation(
     client: Any,
     deployment: str,
     messages: list[Dict[str, Any]],
@@ -55,9 +213,19 @@ def run_mcp_llm_conversation(
     wallet_widget_callback: Any = None,
     status_callback: Optional[Callable[[Any], None]] = None,
 ) -> None:
-    pending = client.chat.completions.create(
+    """Drive the tool-calling loop against an Azure OpenAI client.
+
+    ``AsyncAzureOpenAI`` is awaited directly; a synchronous ``AzureOpenAI``
+    client is run on the shared tool pool. Read-only tool calls emitted in the
+    same round are dispatched concurrently on that pool and writes one at a
+    time; results are appended to ``messages`` and rendered in the original
+    call order on the script thread.
+    """
+
+    pending = await _create_completion(
+        client,
         model=deployment,
-        messages=messages,
+        messages=_trim_messages(messages),
         tools=tools_schema,
         tool_choice="auto",
     )
@@ -68,6 +236,7 @@ def run_mcp_llm_conversation(
     max_tool_calls = 50  # Prevent infinite loops
 
     wallet_pause_requested = False
+    script_ctx = get_script_run_ctx()
 
     while True:
         message = pending.choices[0].message
@@ -86,104 +255,65 @@ def run_mcp_llm_conversation(
                         "If a transaction is pending, please approve it in MetaMask and I'll continue."
                     )
                 break
-            messages.append(message.model_dump())
+            messages.append(
+                message.model_dump(exclude_none=True, exclude_unset=True, mode="python")
+            )
+
             for tool_call in tool_calls:
-                tool_name = tool_call.function.name
-                args_payload = tool_call.function.arguments or "{}"
-                try:
-                    arguments = json.loads(args_payload) if args_payload else {}
-                except json.JSONDecodeError:
-                    arguments = {}
+                if tool_call.function.name in function_map:
+                    _notify_status(
+                        status_callback,
+                        {"phase": "start", "tool": tool_call.function.name},
+                    )
 
-                logger.info(
-                    "Tool call '%s' invoked with args: %s", tool_name, arguments
+            tool_outputs = await _dispatch_tool_calls(
+                tool_calls, function_map, script_ctx
+            )
+
+            rendered_outputs: list[tuple[str, str]] = []
+            for tool_call, tool_output in zip(tool_calls, tool_outputs):
+                tool_name = tool_call.function.name
+                parsed_response = _parse_tool_output(tool_output)
+                tool_success_flag = isinstance(parsed_response, dict) and bool(
+                    parsed_response.get("success")
                 )
 
-                handler = function_map.get(tool_name)
-                if handler is None:
-                    logger.warning("Tool '%s' is not registered.", tool_name)
-                    tool_output = tool_error(f"Tool '{tool_name}' is not registered.")
-                else:
-                    parsed_response: Any = None
-                    tool_success_flag = False
-                    try:
-                        if status_callback:
-                            try:
-                                status_callback({"phase": "start", "tool": tool_name})
-                            except Exception:
-                                logger.exception(
-                                    "Status callback raised an error while starting '%s'",
-                                    tool_name,
-                                )
-                        logger.info("Tool '%s' executing...", tool_name)
-                        response_payload = handler(**arguments)
-                        tool_output = (
-                            response_payload
-                            if isinstance(response_payload, str)
-                            else tool_success(response_payload)
+                # Check if tool returned a MetaMask transaction request
+                if tool_success_flag and "metamask" in parsed_response:
+                    metamask_data = parsed_response["metamask"]
+                    tx_request = metamask_data.get("tx_request")
+                    if tx_request:
+                        sequence = int(time.time() * 1000)
+                        pending_cmd = {
+                            "command": "send_transaction",
+                            "tx_request": tx_request,
+                            "label": metamask_data.get("hint", "Confirm Transaction"),
+                            "sequence": sequence,
+                        }
+                        if "chainId" in metamask_data:
+                            pending_cmd["chainId"] = metamask_data["chainId"]
+                            if isinstance(tx_request, dict):
+                                tx_request["chainId"] = metamask_data["chainId"]
+                        st.session_state["chatbot_wallet_pending_command"] = pending_cmd
+                        st.session_state["chatbot_needs_tx_rerun"] = True
+                        st.session_state["chatbot_waiting_for_wallet"] = True
+                        wallet_pause_requested = True
+                        logger.info(
+                            "Stored transaction request for GPT-triggered MetaMask popup"
                         )
+                        tool_output = _dumps(parsed_response)
 
-                        parsed_response = _parse_tool_output(tool_output)
-                        if isinstance(parsed_response, dict):
-                            tool_success_flag = bool(parsed_response.get("success"))
-
-                        # Check if tool returned a MetaMask transaction request
-                        if (
-                            isinstance(parsed_response, dict)
-                            and parsed_response.get("success")
-                            and "metamask" in parsed_response
-                        ):
-                            metamask_data = parsed_response["metamask"]
-                            tx_request = metamask_data.get("tx_request")
-                            if tx_request:
-                                sequence = int(time.time() * 1000)
-                                pending_cmd = {
-                                    "command": "send_transaction",
-                                    "tx_request": tx_request,
-                                    "label": metamask_data.get(
-                                        "hint", "Confirm Transaction"
-                                    ),
-                                    "sequence": sequence,
-                                }
-                                if "chainId" in metamask_data:
-                                    pending_cmd["chainId"] = metamask_data["chainId"]
-                                    if isinstance(tx_request, dict):
-                                        tx_request["chainId"] = metamask_data["chainId"]
-                                st.session_state["chatbot_wallet_pending_command"] = (
-                                    pending_cmd
-                                )
-                                st.session_state["chatbot_needs_tx_rerun"] = True
-                                st.session_state["chatbot_waiting_for_wallet"] = True
-                                wallet_pause_requested = True
-                                logger.info(
-                                    "Stored transaction request for GPT-triggered MetaMask popup"
-                                )
-                                tool_output = json.dumps(parsed_response)
-
-                        logger.info("Tool '%s' completed successfully", tool_name)
-                    except Exception as exc:  # pragma: no cover - surfaced via UI only
-                        logger.exception(
-                            "Tool '%s' raised an exception: %s", tool_name, exc
-                        )
-                        tool_output = tool_error(str(exc))
-                        parsed_response = _parse_tool_output(tool_output)
-                        tool_success_flag = False
-                    finally:
-                        if status_callback:
-                            try:
-                                status_callback(
-                                    {
-                                        "phase": "complete",
-                                        "tool": tool_name,
-                                        "success": tool_success_flag,
-                                        "payload": parsed_response,
-                                    }
-                                )
-                            except Exception:
-                                logger.exception(
-                                    "Status callback raised an error while finishing '%s'",
-                                    tool_name,
-                                )
+                if tool_name in function_map:
+                    logger.info("Tool '%s' completed", tool_name)
+                    _notify_status(
+                        status_callback,
+                        {
+                            "phase": "complete",
+                            "tool": tool_name,
+                            "success": tool_success_flag,
+                            "payload": parsed_response,
+                        },
+                    )
 
                 logger.info(
                     "Tool '%s' response: %s",
@@ -199,7 +329,10 @@ def run_mcp_llm_conversation(
                         "content": tool_output,
                     }
                 )
-                render_tool_message(tool_name, tool_output)
+                rendered_outputs.append((tool_name, tool_output))
+
+            # One chat bubble per round instead of one per tool call.
+            render_tool_messages(rendered_outputs)
 
             if wallet_pause_requested:
                 logger.info(
@@ -207,9 +340,10 @@ def run_mcp_llm_conversation(
                 )
                 break
 
-            pending = client.chat.completions.create(
+            pending = await _create_completion(
+                client,
                 model=deployment,
-                messages=messages,
+                messages=_trim_messages(messages),
                 tools=tools_schema,
                 tool_choice="auto",
             )
@@ -223,11 +357,4 @@ def run_mcp_llm_conversation(
         logger.info("MCP conversation loop complete. Exiting.")
         break
 
-    if status_callback:
-        try:
-            status_callback({"phase": "idle"})
-        except Exception:
-            logger.exception("Status callback raised an error during final reset")
-
-    if wallet_pause_requested:
-        return
+    _notify_status(status_callback, {"phase": "idle"})
@@ -1,13 +1,20 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 
-def load_lottie_json(filepath: Path) -> dict[str, Any] | None:
+@lru_cache(maxsize=8)
+def _load_lottie_file(path_str: str) -> dict[str, Any] | None:
     try:
-        with filepath.open("r", encoding="utf-8") as f:
+        with open(path_str, "r", encoding="utf-8") as f:
             return json.load(f)
     except Exception:
         return None
+
+
+def load_lottie_json(filepath: Path) -> dict[str, Any] | None:
+    # Cached per resolved path; callers must treat the result as read-only.
+    return _load_lottie_file(str(filepath.resolve()))
@@ -26,6 +26,12 @@ from ..config import (
     USDC_ABI_PATH_ENV,
     USDC_DECIMALS_ENV,
 )
+from ..mcp_lib.resources import (
+    cached_abi,
+    cached_contract,
+    cached_sbt_toolkit,
+    cached_web3,
+)
 from ..toolkit import (
     tool_success,
     tool_error,
@@ -33,17 +39,18 @@ from ..toolkit import (
     build_lending_pool_toolkit,
     build_bridge_toolkit,
     build_sbt_guard,
+    chain_id_for,
     render_llm_history,
 )
 from ..toolkit_lib.borrower_bridge_tools import build_borrower_bridge_toolkit
-from ..web3_utils import get_web3_client, load_contract_abi
+from ..web3_utils import get_web3_client
 from ..wallet_connect_component import wallet_command, connect_wallet
 from ..session import DEFAULT_SESSION_KEY
 from ..verification.verification_flow import run_verification_flow
 from .attachments import build_attachment_context
-from .azure_client import create_azure_client
+from .azure_client import close_after, create_async_azure_client
 from .chat_state import append_message, initialize_chat_state
-from .constants import AZURE_DEPLOYMENT_ENV, WAVES_PATH
+from .constants import ASSIGNABLE_ROLES, AZURE_DEPLOYMENT_ENV, ROLE_NAMES, WAVES_PATH
 from .conversation import run_mcp_llm_conversation
 from .lottie import load_lottie_json
 
@@ -371,6 +378,26 @@ def _update_combined_upload_payloads() -> None:
     st.session_state["verification_uploaded_file_payloads"] = combined
 
 
+_POOL_TOOLKIT_KEY = "chatbot_pool_toolkit"
+
+
+def _session_pool_toolkit(
+    signature: Tuple[Any, ...],
+    build: Callable[[], Tuple[list[Dict[str, Any]], Dict[str, Any]]],
+) -> Tuple[list[Dict[str, Any]], Dict[str, Any]]:
+    """Reuse this session's LendingPool toolkit while its config is unchanged.
+
+    Cached per session rather than with st.cache_resource because the toolkit
+    reads the live ``role_addresses`` dict that the chat state tools mutate.
+    """
+    cached = st.session_state.get(_POOL_TOOLKIT_KEY)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    toolkit = build()
+    st.session_state[_POOL_TOOLKIT_KEY] = (signature, toolkit)
+    return toolkit
+
+
 def _guard_issue_score(handler: Callable[..., str]) -> Callable[..., str]:
     def _wrapped(*, wallet_address: str, score_value: int, **kwargs: Any) -> str:
         try:
@@ -872,8 +899,7 @@ def _build_chatbot_state_tools(
         if not role:
             return tool_error("Role name is required.")
         normalized_role = role.strip().capitalize()
-        allowed_roles = {"Owner", "Lender", "Borrower"}
-        if normalized_role not in allowed_roles:
+        if normalized_role not in ASSIGNABLE_ROLES:
             return tool_error("Role must be one of Owner, Lender, or Borrower.")
 
         address = wallet_address
@@ -2140,7 +2166,7 @@ def render_chatbot_page() -> None:
     )
     clip_len = int(os.getenv("CHATBOT_ATTACHMENT_MAX_CHARS", "6000"))
 
-    client = create_azure_client()
+    client = create_async_azure_client()
     if client is None:
         st.info(
             "Set environment variables `AZURE_OPENAI_ENDPOINT`, `AZURE_OPENAI_KEY`, and optionally `AZURE_OPENAI_API_VERSION` "
@@ -2238,7 +2264,7 @@ def render_chatbot_page() -> None:
     default_gas_limit = int(os.getenv(GAS_LIMIT_ENV, "200000"))
     gas_price_gwei = os.getenv(GAS_PRICE_GWEI_ENV, "1")
 
-    w3 = get_web3_client(rpc_url)
+    w3 = cached_web3(rpc_url)
     if w3 is None:
         info_msg = "Connect to the ARC RPC to unlock MCP tools in chat."
         if prompt:
@@ -2250,16 +2276,16 @@ def render_chatbot_page() -> None:
         return
 
     try:
-        chain_id = w3.eth.chain_id
+        chain_id = chain_id_for(w3)
     except Exception:
         chain_id = None
 
     roles_key = "role_addresses"
     stored_roles = st.session_state.get(roles_key)
     if not isinstance(stored_roles, dict):
-        stored_roles = {"Owner": "", "Lender": "", "Borrower": ""}
+        stored_roles = dict.fromkeys(ROLE_NAMES, "")
     else:
-        for role_name in ("Owner", "Lender", "Borrower"):
+        for role_name in ROLE_NAMES:
             stored_roles.setdefault(role_name, "")
     st.session_state[roles_key] = stored_roles
     role_addresses: Dict[str, str] = stored_roles
@@ -2284,22 +2310,21 @@ def render_chatbot_page() -> None:
     sbt_guard: Optional[Callable[[str], Optional[str]]] = None
     if sbt_address and sbt_abi_path:
         try:
-            sbt_abi = load_contract_abi(sbt_abi_path)
+            sbt_abi = cached_abi(sbt_abi_path)
             if not sbt_abi:
                 sbt_error = f"ABI file loaded but contains no ABI data: {sbt_abi_path}"
             else:
                 try:
-                    sbt_contract = w3.eth.contract(
-                        address=Web3.to_checksum_address(sbt_address), abi=sbt_abi
-                    )
-                    sbt_tools_schema, sbt_function_map = build_llm_toolkit(
-                        w3=w3,
-                        contract=sbt_contract,
-                        token_decimals=0,
-                        private_key=private_key,
-                        default_gas_limit=default_gas_limit,
-                        gas_price_gwei=gas_price_gwei,
+                    sbt_tools_schema, cached_function_map, _ = cached_sbt_toolkit(
+                        rpc_url,
+                        sbt_address,
+                        sbt_abi_path,
+                        default_gas_limit,
+                        gas_price_gwei,
+                        private_key,
                     )
+                    # Copy: issueScore gets wrapped below for this session only.
+                    sbt_function_map = dict(cached_function_map)
                 except ValueError as e:
                     sbt_error = f"Invalid SBT contract address: {e}"
                 except Exception as e:
@@ -2335,28 +2360,41 @@ def render_chatbot_page() -> None:
 
     if pool_address and pool_abi_path:
         try:
-            pool_abi = load_contract_abi(pool_abi_path)
+            pool_abi = cached_abi(pool_abi_path)
             if not pool_abi:
                 pool_error = (
                     f"ABI file loaded but contains no ABI data: {pool_abi_path}"
                 )
             else:
-                usdc_abi = load_contract_abi(usdc_abi_path) if usdc_abi_path else None
+                usdc_abi = cached_abi(usdc_abi_path) if usdc_abi_path else None
                 try:
-                    pool_contract = w3.eth.contract(
-                        address=Web3.to_checksum_address(pool_address), abi=pool_abi
-                    )
-                    pool_tools_schema, pool_function_map = build_lending_pool_toolkit(
-                        w3=w3,
-                        pool_contract=pool_contract,
-                        token_decimals=usdc_decimals,
-                        native_decimals=18,
-                        private_key=private_key,
-                        default_gas_limit=default_gas_limit,
-                        gas_price_gwei=gas_price_gwei,
-                        role_addresses=role_addresses,
-                        role_private_keys=role_private_keys,
-                        borrower_guard=sbt_guard,
+                    pool_tools_schema, pool_function_map = _session_pool_toolkit(
+                        (
+                            rpc_url,
+                            pool_address,
+                            pool_abi_path,
+                            usdc_decimals,
+                            private_key,
+                            default_gas_limit,
+                            gas_price_gwei,
+                            id(role_addresses),
+                            tuple(sorted(role_private_keys.items())),
+                            sbt_guard,
+                        ),
+                        lambda: build_lending_pool_toolkit(
+                            w3=w3,
+                            pool_contract=cached_contract(
+                                rpc_url, pool_address, pool_abi_path
+                            ),
+                            token_decimals=usdc_decimals,
+                            native_decimals=18,
+                            private_key=private_key,
+                            default_gas_limit=default_gas_limit,
+                            gas_price_gwei=gas_price_gwei,
+                            role_addresses=role_addresses,
+                            role_private_keys=role_private_keys,
+                            borrower_guard=sbt_guard,
+                        ),
                     )
                 except ValueError as e:
                     pool_error = f"Invalid LendingPool contract address: {e}"
@@ -2525,14 +2563,19 @@ cd blockchain_code && forge build""",
     def _run_conversation_with_status(
         callback: Callable[[Optional[str]], None],
     ) -> None:
-        run_mcp_llm_conversation(
-            client,
-            deployment,
-            st.session_state.messages,
-            tools_schema,
-            function_map,
-            wallet_widget_callback=None,
-            status_callback=callback,
+        asyncio.run(
+            close_after(
+                client,
+                run_mcp_llm_conversation(
+                    client,
+                    deployment,
+                    st.session_state.messages,
+                    tools_schema,
+                    function_map,
+                    wallet_widget_callback=None,
+                    status_callback=callback,
+                ),
+            )
         )
 
     with st.chat_message("assistant"):
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import os
 from typing import Any, Dict
 
 import streamlit as st
-from web3 import Web3
 
 from ..config import (
     ARC_RPC_ENV,
@@ -14,10 +14,10 @@ from ..config import (
     SBT_ADDRESS_ENV,
     TRUSTMINT_SBT_ABI_PATH_ENV,
 )
-from ..toolkit import build_llm_toolkit, render_llm_history
-from ..web3_utils import get_web3_client, load_contract_abi
-from .azure_client import create_azure_client
-from .constants import AZURE_DEPLOYMENT_ENV, MCP_SYSTEM_PROMPT, WAVES_PATH
+from ..mcp_lib.resources import cached_abi, cached_sbt_toolkit, cached_web3
+from ..toolkit import render_llm_history
+from .azure_client import close_after, create_async_azure_client
+from .constants import AZURE_DEPLOYMENT_ENV, SYSTEM_MSG, WAVES_PATH
 from .conversation import run_mcp_llm_conversation
 from .lottie import load_lottie_json
 
@@ -25,7 +25,7 @@ from .lottie import load_lottie_json
 def render_mcp_llm_playground_section() -> None:
     st.subheader("MCP LLM Playground")
 
-    client = create_azure_client()
+    client = create_async_azure_client()
     if client is None:
         st.info(
             "Configure Azure OpenAI credentials in `.env` (`AZURE_OPENAI_ENDPOINT`, `AZURE_OPENAI_KEY`, "
@@ -44,12 +44,11 @@ def render_mcp_llm_playground_section() -> None:
     contract_address = os.getenv(SBT_ADDRESS_ENV)
     abi_path = os.getenv(TRUSTMINT_SBT_ABI_PATH_ENV)
     private_key = os.getenv(PRIVATE_KEY_ENV)
-    token_decimals = 0
     default_gas_limit = int(os.getenv(GAS_LIMIT_ENV, "200000"))
     gas_price_gwei = os.getenv(GAS_PRICE_GWEI_ENV, "1")
 
-    w3 = get_web3_client(rpc_url)
-    abi = load_contract_abi(abi_path)
+    w3 = cached_web3(rpc_url)
+    abi = cached_abi(abi_path) if abi_path else None
 
     if w3 is None:
         st.info(
@@ -63,29 +62,25 @@ def render_mcp_llm_playground_section() -> None:
         return
 
     try:
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(contract_address), abi=abi
+        tools_schema, function_map, _ = cached_sbt_toolkit(
+            rpc_url,
+            contract_address,
+            abi_path,
+            default_gas_limit,
+            gas_price_gwei,
+            private_key,
         )
     except Exception as exc:
         st.error(f"Unable to build contract instance: {exc}")
         return
 
-    tools_schema, function_map = build_llm_toolkit(
-        w3=w3,
-        contract=contract,
-        token_decimals=token_decimals,
-        private_key=private_key,
-        default_gas_limit=default_gas_limit,
-        gas_price_gwei=gas_price_gwei,
-    )
-
     if not tools_schema:
         st.warning("No MCP tools are available for the current contract configuration.")
         return
 
     messages = st.session_state.setdefault(
         "mcp_llm_messages",
-        [{"role": "system", "content": MCP_SYSTEM_PROMPT}],
+        [dict(SYSTEM_MSG)],
     )
 
     render_llm_history(messages)
@@ -107,10 +102,20 @@ def render_mcp_llm_playground_section() -> None:
             from streamlit_lottie import st_lottie_spinner
 
             with st_lottie_spinner(waves, key="waves_spinner_playground"):
-                run_mcp_llm_conversation(
-                    client, deployment, messages, tools_schema, function_map
+                asyncio.run(
+                    close_after(
+                        client,
+                        run_mcp_llm_conversation(
+                            client, deployment, messages, tools_schema, function_map
+                        ),
+                    )
                 )
         else:
-            run_mcp_llm_conversation(
-                client, deployment, messages, tools_schema, function_map
+            asyncio.run(
+                close_after(
+                    client,
+                    run_mcp_llm_conversation(
+                        client, deployment, messages, tools_schema, function_map
+                    ),
+                )
             )
@@ -2,20 +2,17 @@
 
 from __future__ import annotations
 
-import time
+from collections import deque
 from pathlib import Path
-import json
 from typing import Any, Optional
 from pathlib import Path
 import base64
 
 import os
-import random
+import time
 from typing import Optional
 
-import pandas as pd
 import streamlit as st
-from web3 import Web3
 
 from .config import (
     ARC_RPC_ENV,
@@ -30,36 +27,132 @@ HERO_ASSETS = [
     Path(__file__).resolve().parents[1] / "gifs" / "sniffer_bank.gif",
 ]
 LIQ_HISTORY_KEY = "intro_liquidity_history"
+LIQ_HISTORY_LEN = 10
+# LendingPool views shown on the intro page; read together in one batch.
+POOL_METRIC_FUNCTIONS: tuple[str, ...] = ("availableLiquidity",)
+# (name, role, blurb, links) for each Pack Leaders card.
+PACK_LEADERS: tuple[tuple[str, str, str, str], ...] = (
+    (
+        "Abdul 🐕",
+        "Backend & Blockchain",
+        "Keeps the lending contracts obedient and wires wallet flows so every bridge prompt feels like a belly rub.",
+        "🔗 [GitHub](https://github.com/AbdulAaqib) | 💼 [LinkedIn](https://www.linkedin.com/in/abdulaaqib/)",
+    ),
+    (
+        "Junaid 🔧",
+        "DevOps & Engineering Wrangler",
+        "Keeps infra leashes tight, deployments zoomie-free, and Streamlit sessions hydrated for every fetch request.",
+        "🔗 [GitHub](https://github.com/Junaid2005) | 💼 [LinkedIn](https://www.linkedin.com/in/junaid-mohammad-4a4091260/)",
+    ),
+    (
+        "Sukhran 🛠️",
+        "Backend & Blockchain",
+        "Former chew-toy engineer, now architecting ledgers Collie trusts for borrower scoring and ARC liquidity.",
+        "💼 [LinkedIn](https://www.linkedin.com/in/mohammed-talat-28064a1b2/)",
+    ),
+    (
+        "Walid 🦮",
+        "Lead Strategy",
+        "Decides which hydrants we conquer next, pairing market instincts with Collie-approved borrower journeys.",
+        "💼 [LinkedIn](https://www.linkedin.com/in/walid-m-155819267/)",
+    ),
+)
+
+
+def _stream_text(text: str, chunk: int = 8, delay: float = 0.0):
+    """Yield ``chunk``-sized slices of text for ``st.write_stream``.
 
+    ``delay`` is opt-in; the default streams without sleeping on the script
+    thread.
+    """
 
-def _stream_text(text: str, delay: float = 0.04):
-    """Yield text one character at a time for a typewriter effect."""
+    step = max(chunk, 1)
+    for start in range(0, len(text), step):
+        yield text[start : start + step]
+        if delay:
+            time.sleep(delay)
 
-    for char in text:
-        yield char
-        time.sleep(delay)
+
+@st.cache_resource(show_spinner=False)
+def _hero_asset() -> Optional[tuple[bytes, str]]:
+    """Return the first available hero asset as ``(data, suffix)``."""
+
+    for asset in HERO_ASSETS:
+        if not asset.exists():
+            continue
+        try:
+            return asset.read_bytes(), asset.suffix.lower()
+        except OSError:
+            continue
+    return None
 
 
 def _show_hero_image(
     target: Optional[st.delta_generator.DeltaGenerator] = None,
 ) -> None:
     container = target or st
-    for asset in HERO_ASSETS:
-        if not asset.exists():
-            continue
-        suffix = asset.suffix.lower()
+    hero = _hero_asset()
+    if hero is not None:
+        data, suffix = hero
         try:
             if suffix in {".gif", ".png", ".jpg", ".jpeg"}:
-                container.image(str(asset), width=220)
+                container.image(data, width=220)
                 return
             if suffix in {".mp4", ".mov", ".webm"}:
-                container.video(str(asset))
+                container.video(data)
                 return
         except Exception:
-            continue
+            pass
     container.caption("🐾 (Hero animation unavailable)")
 
 
+@st.cache_resource(show_spinner=False)
+def _cached_abi(abi_path: str) -> Optional[list[dict[str, Any]]]:
+    return load_contract_abi(abi_path)
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_pool_contract(rpc_url: str, pool_address: str, abi_path: str) -> Any:
+    from web3 import Web3
+
+    # Raise instead of returning None so failures are not cached.
+    w3 = get_web3_client(rpc_url)
+    if w3 is None:
+        raise ConnectionError(f"Unable to reach RPC endpoint {rpc_url}")
+    abi = _cached_abi(abi_path)
+    if not abi:
+        raise ValueError(f"No ABI data found at {abi_path}")
+    return w3.eth.contract(address=Web3.to_checksum_address(pool_address), abi=abi)
+
+
+def _read_pool_metrics(contract: Any) -> dict[str, int]:
+    """Read every entry of ``POOL_METRIC_FUNCTIONS`` in one JSON-RPC batch."""
+
+    calls = [getattr(contract.functions, name)() for name in POOL_METRIC_FUNCTIONS]
+    try:
+        with contract.w3.batch_requests() as batch:
+            for call in calls:
+                batch.add(call)
+            results = batch.execute()
+    except Exception:
+        # RPC endpoint without batch support: fall back to sequential reads.
+        results = [call.call() for call in calls]
+    return dict(zip(POOL_METRIC_FUNCTIONS, results))
+
+
+@st.cache_data(ttl=15, show_spinner=False)
+def _cached_pool_metrics(
+    rpc_url: str, pool_address: str, abi_path: str, decimals: int
+) -> dict[str, float]:
+    try:
+        contract = _cached_pool_contract(rpc_url, pool_address, abi_path)
+        raw_metrics = _read_pool_metrics(contract)
+    except Exception:
+        return {}
+    scale = 10**decimals
+    return {name: int(value) / scale for name, value in raw_metrics.items()}
+
+
 def _fetch_available_liquidity_usdc() -> Optional[float]:
     rpc_url = os.getenv(ARC_RPC_ENV)
     pool_address = os.getenv(LENDING_POOL_ADDRESS_ENV)
@@ -67,25 +160,13 @@ def _fetch_available_liquidity_usdc() -> Optional[float]:
     decimals = int(os.getenv(USDC_DECIMALS_ENV, "18"))
     if not (rpc_url and pool_address and abi_path):
         return None
-    try:
-        w3 = get_web3_client(rpc_url)
-        if w3 is None:
-            return None
-        abi = load_contract_abi(abi_path)
-        if not abi:
-            return None
-        contract = w3.eth.contract(
-            address=Web3.to_checksum_address(pool_address), abi=abi
-        )
-        raw_units = contract.functions.availableLiquidity().call()
-        return raw_units / (10**decimals)
-    except Exception:
-        return None
-    client = Web3(Web3.HTTPProvider(rpc, request_kwargs={"timeout": 10}))
-    return client if client.is_connected() else None
+    metrics = _cached_pool_metrics(rpc_url, pool_address, abi_path, decimals)
+    return metrics.get("availableLiquidity")
 
 
 def _resolve_session_dataframe(session_key: str) -> Optional[pd.DataFrame]:
+    import pandas as pd
+
     value = st.session_state.get(session_key)
     return value if isinstance(value, pd.DataFrame) else None
 
@@ -124,25 +205,75 @@ def render_intro_page() -> None:
     col3.metric("Invoice Count", invoice_count if invoice_count is not None else "—")
 
 
-def _liquidity_history() -> list[float]:
+def _liquidity_history() -> deque[float]:
     history = st.session_state.get(LIQ_HISTORY_KEY)
-    if isinstance(history, list) and history:
+    if isinstance(history, deque) and history:
         return history
-    seed = [1.20, 1.18, 1.19, 1.21, 1.23]
+    seed = deque([1.20, 1.18, 1.19, 1.21, 1.23], maxlen=LIQ_HISTORY_LEN)
     st.session_state[LIQ_HISTORY_KEY] = seed
     return seed
 
 
-def _update_liquidity_history(value: Optional[float]) -> list[float]:
-    history = list(_liquidity_history())
+def _update_liquidity_history(value: Optional[float]) -> deque[float]:
+    history = _liquidity_history()
     if value is not None:
         history.append(value)
-        history = history[-10:]
-        st.session_state[LIQ_HISTORY_KEY] = history
     return history
     render_team_intro()
 
 
+@st.fragment(run_every=15)
+def _liquidity_panel() -> None:
+    """Sparkline metric for pool liquidity; refreshes on its own every 15s."""
+
+    import numpy as np
+    import pandas as pd
+
+    liquidity_value = _fetch_available_liquidity_usdc()
+    liquidity_series = _update_liquidity_history(liquidity_value)
+    latest_liq = liquidity_series[-1]
+    steps = np.random.uniform(0.01, 0.05, size=9)
+    spark_values = latest_liq + np.concatenate(([0.0], np.cumsum(steps)))
+    chart_df = pd.DataFrame({"liquidity": np.round(spark_values, 3)})
+
+    st.markdown("<div style='margin-top:-1.5rem;'></div>", unsafe_allow_html=True)
+    st.caption("ARC Pool Liquidity (USDC)")
+    help_text = (
+        "Live availableLiquidity via LendingPool contract"
+        if liquidity_value is not None
+        else "Env/LendingPool config missing — showing cached mock data"
+    )
+    st.metric(
+        label="Available Liquidity",
+        value=f"{latest_liq:.2f} USDC",
+        chart_data=chart_df,
+        help=help_text,
+        border=True,
+    )
+    st.markdown(
+        """
+        <style>
+            div[data-testid="stMetricValue"] + div canvas {{
+                stroke: #16a34a !important;
+            }}
+            div[data-testid="stMetricValue"] + div path {{
+                stroke: #16a34a !important;
+            }}
+        </style>
+        """,
+        unsafe_allow_html=True,
+    )
+
+
+def _pack_leaders() -> None:
+    st.subheader("Pack Leaders")
+    columns = st.columns(len(PACK_LEADERS), vertical_alignment="top")
+    for col, (name, role, blurb, links) in zip(columns, PACK_LEADERS):
+        with col:
+            with st.container(border=True, height=320):
+                st.markdown(f"### {name}\n**{role}**\n\n{blurb}\n\n{links}")
+
+
 def render_intro_page() -> None:
     """Render the whimsical PawChain landing page."""
 
@@ -150,42 +281,8 @@ def render_intro_page() -> None:
 
     dog_col, spark_col = st.columns([1, 1], vertical_alignment="center")
 
-    liquidity_value = _fetch_available_liquidity_usdc()
-    liquidity_series = _update_liquidity_history(liquidity_value)
-    latest_liq = liquidity_series[-1]
-    spark_values = [latest_liq]
-    for _ in range(9):
-        spark_values.append(spark_values[-1] + random.uniform(0.01, 0.05))
-    chart_df = pd.DataFrame({"liquidity": [round(val, 3) for val in spark_values]})
-
     with spark_col:
-        spark_col.markdown("<div style='margin-top:-1.5rem;'></div>", unsafe_allow_html=True)
-        spark_col.caption("ARC Pool Liquidity (USDC)")
-        help_text = (
-            "Live availableLiquidity via LendingPool contract"
-            if liquidity_value is not None
-            else "Env/LendingPool config missing — showing cached mock data"
-        )
-        meta = spark_col.metric(
-            label="Available Liquidity",
-            value=f"{latest_liq:.2f} USDC",
-            chart_data=chart_df,
-            help=help_text,
-            border=True,
-        )
-        spark_col.markdown(
-            """
-            <style>
-                div[data-testid="stMetricValue"] + div canvas {{
-                    stroke: #16a34a !important;
-                }}
-                div[data-testid="stMetricValue"] + div path {{
-                    stroke: #16a34a !important;
-                }}
-            </style>
-            """,
-            unsafe_allow_html=True,
-        )
+        _liquidity_panel()
 
     with dog_col:
         _show_dog_gif()
@@ -212,50 +309,7 @@ Collie’s daily routine: **Fetch invoices**, **Chase delinquent payments**, and
         """
     )
 
-    st.subheader("Pack Leaders")
-    col1, col2, col3, col4 = st.columns(4, vertical_alignment="top")
-
-    with col1:
-        with st.container(border=True, height=320):
-            st.subheader("Abdul 🐕")
-            st.markdown("**Backend & Blockchain**")
-            st.write(
-                "Keeps the lending contracts obedient and wires wallet flows so every bridge prompt feels like a belly rub."
-            )
-            st.markdown(
-                "🔗 [GitHub](https://github.com/AbdulAaqib) | 💼 [LinkedIn](https://www.linkedin.com/in/abdulaaqib/)"
-            )
-
-    with col2:
-        with st.container(border=True, height=320):
-            st.subheader("Junaid 🔧")
-            st.markdown("**DevOps & Engineering Wrangler**")
-            st.write(
-                "Keeps infra leashes tight, deployments zoomie-free, and Streamlit sessions hydrated for every fetch request."
-            )
-            st.markdown(
-                "🔗 [GitHub](https://github.com/Junaid2005) | 💼 [LinkedIn](https://www.linkedin.com/in/junaid-mohammad-4a4091260/)"
-            )
-
-    with col3:
-        with st.container(border=True, height=320):
-            st.subheader("Sukhran 🛠️")
-            st.markdown("**Backend & Blockchain**")
-            st.write(
-                "Former chew-toy engineer, now architecting ledgers Collie trusts for borrower scoring and ARC liquidity."
-            )
-            st.markdown(
-                "💼 [LinkedIn](https://www.linkedin.com/in/mohammed-talat-28064a1b2/)"
-            )
-
-    with col4:
-        with st.container(border=True, height=320):
-            st.subheader("Walid 🦮")
-            st.markdown("**Lead Strategy**")
-            st.write(
-                "Decides which hydrants we conquer next, pairing market instincts with Collie-approved borrower journeys."
-            )
-            st.markdown("💼 [LinkedIn](https://www.linkedin.com/in/walid-m-155819267/)")
+    _pack_leaders()
 
     st.divider()
     st.info(
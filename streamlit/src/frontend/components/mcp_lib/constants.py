@@ -2,6 +2,8 @@ from __future__ import annotations
 
 LOGGER_NAME = "arc.mcp_polygon"
 
+ROLE_NAMES = ("Owner", "Lender", "Borrower")
+
 SBT_TOOL_ROLES = {
     "hasSbt": "Read-only",
     "getScore": "Read-only",
@@ -12,6 +14,7 @@ SBT_TOOL_ROLES = {
 POOL_TOOL_ROLES = {
     "availableLiquidity": "Read-only",
     "lenderBalance": "Read-only",
+    "lenderStatus": "Read-only",
     "getLoan": "Read-only",
     "isBanned": "Read-only",
     "deposit": "Lender",
@@ -20,6 +23,22 @@ POOL_TOOL_ROLES = {
     "repay": "Borrower",
     "checkDefaultAndBan": "Owner",
     "unban": "Owner",
+    "txStatus": "Read-only",
+}
+
+# Tools that never change state; a chat round may run these concurrently.
+READ_ONLY_TOOLS = frozenset(
+    name
+    for roles in (SBT_TOOL_ROLES, POOL_TOOL_ROLES)
+    for name, role in roles.items()
+    if role == "Read-only"
+)
+
+# Pre-filled form values for LendingPool write tools in the MCP runner.
+POOL_PARAMETER_DEFAULTS = {
+    "deposit": {"amount": 0.1},
+    "withdraw": {"amount": 0.1},
+    "openLoan": {"principal": 0.1, "term_seconds": 604800},
 }
 
 MCP_BRIDGE_SESSION_KEY = "mcp_cctp_bridge_state"
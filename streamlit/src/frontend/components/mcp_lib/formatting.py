@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import orjson
+
+_PRETTY_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+
+def pretty_json(value: Any) -> str:
+    """Indented JSON for ``st.code(..., language="json")`` display."""
+
+    try:
+        return orjson.dumps(value, default=str, option=_PRETTY_OPTIONS).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects ints wider than 64 bits (e.g. uint256 wei amounts).
+        return json.dumps(value, default=str, indent=2)
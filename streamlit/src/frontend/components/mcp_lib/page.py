@@ -8,24 +8,18 @@ from decimal import Decimal, InvalidOperation
 from typing import Any, Dict, Optional
 
 import streamlit as st
-from web3 import Web3
 
 from ..config import (
     ARC_RPC_ENV,
-    SBT_ADDRESS_ENV,
     TRUSTMINT_SBT_ABI_PATH_ENV,
     PRIVATE_KEY_ENV,
     GAS_LIMIT_ENV,
     GAS_PRICE_GWEI_ENV,
-    USDC_DECIMALS_ENV,
     LENDING_POOL_ADDRESS_ENV,
     LENDING_POOL_ABI_PATH_ENV,
-    USDC_ADDRESS_ENV,
-    USDC_ABI_PATH_ENV,
     BRIDGE_PRIVATE_KEY_ENV,
     POLYGON_RPC_ENV,
     POLYGON_PRIVATE_KEY_ENV,
-    get_sbt_address,
 )
 from ..cctp_bridge import (
     POLYGON_AMOY_CHAIN_ID,
@@ -36,36 +30,27 @@ from ..cctp_bridge import (
     transfer_arc_usdc,
 )
 
-from ..toolkit import build_llm_toolkit, build_lending_pool_toolkit
+from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
 from ..verification.score_calculator import wallet_summary_to_score
 from ..verification.verification_flow import run_verification_flow
 from ..wallet_connect_component import connect_wallet, wallet_command
-from ..web3_utils import get_web3_client, load_contract_abi
-from ..toolkit import build_llm_toolkit, build_lending_pool_toolkit, build_sbt_guard
-from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
-from ..wallet_connect_component import connect_wallet, wallet_command
-from ..web3_utils import get_web3_client, load_contract_abi
-from .logging_utils import get_metamask_logger
-from ..toolkit import build_llm_toolkit, build_lending_pool_toolkit, build_sbt_guard
-from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
-from ..wallet_connect_component import connect_wallet, wallet_command
-from ..web3_utils import get_web3_client, load_contract_abi
-
-from ..toolkit import build_llm_toolkit, build_lending_pool_toolkit, build_sbt_guard
-from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
-from ..wallet_connect_component import connect_wallet, wallet_command
-from ..web3_utils import get_web3_client, load_contract_abi
-from ..toolkit import build_llm_toolkit, build_lending_pool_toolkit, build_sbt_guard
-from ..toolkit_lib.config_utils import resolve_lending_pool_abi_path
-from ..wallet_connect_component import connect_wallet, wallet_command
-from ..web3_utils import get_web3_client, load_contract_abi
 from .logging_utils import get_metamask_logger
+from .resources import (
+    cached_chain_id,
+    cached_pool_toolkit,
+    cached_sbt_guard,
+    cached_sbt_toolkit,
+    cached_web3,
+    env_config,
+)
 from .rerun import st_rerun
 from .tool_runner import render_tool_runner
 from .constants import (
     LOGGER_NAME,
+    ROLE_NAMES,
     SBT_TOOL_ROLES,
     POOL_TOOL_ROLES,
+    POOL_PARAMETER_DEFAULTS,
     MCP_BRIDGE_SESSION_KEY,
     MCP_ARC_TRANSFER_SESSION_KEY,
     MCP_POLYGON_COMMAND_KEY,
@@ -944,13 +929,7 @@ def _render_verification_section() -> None:
     verification_results_key = "verification_results"
 
     # Get chain_id for wallet connection (same as used in role assignment)
-    rpc_url = os.getenv(ARC_RPC_ENV)
-    w3 = get_web3_client(rpc_url)
-    chain_id = None
-    try:
-        chain_id = w3.eth.chain_id if w3 else None
-    except Exception:
-        chain_id = None
+    chain_id = cached_chain_id(env_config().rpc_url)
 
     # Connect to MetaMask wallet
     wallet_info = connect_wallet(
@@ -1270,32 +1249,24 @@ def render_mcp_tools_page() -> None:
     st.title("🧪 Direct MCP Tool Tester")
     st.caption("Run MCP tools for TrustMintSBT and LendingPool.")
 
-    rpc_url = os.getenv(ARC_RPC_ENV)
-    private_key_env = os.getenv(PRIVATE_KEY_ENV)
-    default_gas_limit = int(os.getenv(GAS_LIMIT_ENV, "200000"))
-    gas_price_gwei = os.getenv(GAS_PRICE_GWEI_ENV, "1")
+    env = env_config()
+    rpc_url = env.rpc_url
+    default_gas_limit = env.default_gas_limit
+    gas_price_gwei = env.gas_price_gwei
 
-    w3 = get_web3_client(rpc_url)
-
-    chain_id = None
-    try:
-        chain_id = w3.eth.chain_id if w3 else None
-    except Exception:
-        chain_id = None
+    w3 = cached_web3(rpc_url)
+    chain_id = cached_chain_id(rpc_url)
 
     roles_key = "role_addresses"
-    role_addresses: Dict[str, str] = (
-        st.session_state.get(roles_key, {})
-        if isinstance(st.session_state.get(roles_key), dict)
-        else {}
-    )
-    role_addresses.setdefault("Owner", "")
-    role_addresses.setdefault("Lender", "")
-    role_addresses.setdefault("Borrower", "")
+    role_addresses: Dict[str, str] = st.session_state.setdefault(roles_key, {})
+    if not isinstance(role_addresses, dict):
+        role_addresses = st.session_state[roles_key] = {}
+    for role_name in ROLE_NAMES:
+        role_addresses.setdefault(role_name, "")
 
-    owner_pk = os.getenv(PRIVATE_KEY_ENV)
-    lender_pk = os.getenv("LENDER_PRIVATE_KEY")
-    borrower_pk = os.getenv("BORROWER_PRIVATE_KEY")
+    owner_pk = env.private_key
+    lender_pk = env.lender_pk
+    borrower_pk = env.borrower_pk
 
     role_private_keys = {
         "Owner": owner_pk,
@@ -1345,7 +1316,7 @@ def render_mcp_tools_page() -> None:
         with assignment_col:
             role_choice = st.selectbox(
                 "Assign connected wallet to role",
-                ["Owner", "Lender", "Borrower"],
+                ROLE_NAMES,
                 key="role_assignment_choice",
             )
             if current_address:
@@ -1372,7 +1343,7 @@ def render_mcp_tools_page() -> None:
             st.json(role_addresses)
 
         st.markdown("### Signing sources")
-        for role_name in ("Owner", "Lender", "Borrower"):
+        for role_name in ROLE_NAMES:
             pk_value = role_private_keys.get(role_name)
             addr = role_addresses.get(role_name)
             if pk_value:
@@ -1394,29 +1365,29 @@ def render_mcp_tools_page() -> None:
     with tab_toolkits:
         st.subheader("TrustMint SBT Tools")
 
-        sbt_address_env = get_sbt_address()
-        sbt_address = sbt_address_env[0]
-        sbt_env_name = sbt_address_env[1] or SBT_ADDRESS_ENV
-        sbt_abi_path = os.getenv(TRUSTMINT_SBT_ABI_PATH_ENV)
+        sbt_address = env.sbt_address
+        sbt_env_name = env.sbt_env_name
+        sbt_abi_path = env.sbt_abi_path
 
         sbt_tools_schema = []
         sbt_function_map = {}
+        sbt_schema_by_name = None
         sbt_guard = None
         if sbt_address and sbt_abi_path and w3 is not None:
-            sbt_abi = load_contract_abi(sbt_abi_path)
             try:
-                sbt_contract = w3.eth.contract(
-                    address=Web3.to_checksum_address(sbt_address), abi=sbt_abi
+                (
+                    sbt_tools_schema,
+                    sbt_function_map,
+                    sbt_schema_by_name,
+                ) = cached_sbt_toolkit(
+                    rpc_url,
+                    sbt_address,
+                    sbt_abi_path,
+                    default_gas_limit,
+                    gas_price_gwei,
+                    owner_pk,
                 )
-                sbt_tools_schema, sbt_function_map = build_llm_toolkit(
-                    w3=w3,
-                    contract=sbt_contract,
-                    token_decimals=0,
-                    private_key=owner_pk,
-                    default_gas_limit=default_gas_limit,
-                    gas_price_gwei=gas_price_gwei,
-                )
-                sbt_guard = build_sbt_guard(w3, sbt_contract)
+                sbt_guard = cached_sbt_guard(rpc_url, sbt_address, sbt_abi_path)
             except Exception as exc:
                 st.warning(f"Unable to build SBT toolkit: {exc}")
 
@@ -1430,6 +1401,7 @@ def render_mcp_tools_page() -> None:
                 sbt_function_map,
                 w3,
                 key_prefix="sbt",
+                schema_by_name=sbt_schema_by_name,
                 role_private_keys=role_private_keys,
                 role_addresses=role_addresses,
                 tool_role_map=SBT_TOOL_ROLES,
@@ -1438,32 +1410,30 @@ def render_mcp_tools_page() -> None:
         st.divider()
         st.subheader("LendingPool Tools")
 
-        pool_address = os.getenv(LENDING_POOL_ADDRESS_ENV)
-        pool_abi_path = os.getenv(LENDING_POOL_ABI_PATH_ENV)
-        usdc_address = os.getenv(USDC_ADDRESS_ENV)
-        usdc_abi_path = os.getenv(USDC_ABI_PATH_ENV)
-        usdc_decimals = int(os.getenv(USDC_DECIMALS_ENV, "6"))
+        pool_address = env.pool_address
+        pool_abi_path = env.pool_abi_path
+        usdc_decimals = env.usdc_decimals
 
         pool_tools_schema = []
         pool_function_map = {}
+        pool_schema_by_name = None
         if pool_address and pool_abi_path and w3 is not None:
-            pool_abi = load_contract_abi(pool_abi_path)
-            usdc_abi = load_contract_abi(usdc_abi_path) if usdc_abi_path else None
             try:
-                pool_contract = w3.eth.contract(
-                    address=Web3.to_checksum_address(pool_address), abi=pool_abi
-                )
-                pool_tools_schema, pool_function_map = build_lending_pool_toolkit(
-                    w3=w3,
-                    pool_contract=pool_contract,
-                    token_decimals=usdc_decimals,
-                    native_decimals=18,
-                    private_key=owner_pk,
-                    default_gas_limit=default_gas_limit,
-                    gas_price_gwei=gas_price_gwei,
-                    role_addresses=role_addresses,
-                    role_private_keys=role_private_keys,
-                    borrower_guard=sbt_guard,
+                (
+                    pool_tools_schema,
+                    pool_function_map,
+                    pool_schema_by_name,
+                ) = cached_pool_toolkit(
+                    rpc_url,
+                    pool_address,
+                    pool_abi_path,
+                    usdc_decimals,
+                    default_gas_limit,
+                    gas_price_gwei,
+                    owner_pk,
+                    tuple(sorted(role_addresses.items())),
+                    tuple(sorted(role_private_keys.items())),
+                    (sbt_address, sbt_abi_path) if sbt_guard is not None else None,
                 )
             except Exception as exc:
                 st.warning(f"Unable to build LendingPool toolkit: {exc}")
@@ -1473,17 +1443,13 @@ def render_mcp_tools_page() -> None:
                 "Set `LENDING_POOL_ADDRESS`, `LENDING_POOL_ABI_PATH`, and optional USDC env vars to enable LendingPool tools."
             )
         else:
-            parameter_defaults = {
-                "deposit": {"amount": 0.1},
-                "withdraw": {"amount": 0.1},
-                "openLoan": {"principal": 0.1, "term_seconds": 604800},
-            }
             render_tool_runner(
                 pool_tools_schema,
                 pool_function_map,
                 w3,
                 key_prefix="pool",
-                parameter_defaults=parameter_defaults,
+                parameter_defaults=POOL_PARAMETER_DEFAULTS,
+                schema_by_name=pool_schema_by_name,
                 role_private_keys=role_private_keys,
                 role_addresses=role_addresses,
                 tool_role_map=POOL_TOOL_ROLES,
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+from typing import Callable
+
 import streamlit as st
 
+_RERUN: Callable[[], None] = (
+    getattr(st, "rerun", None)
+    or getattr(st, "experimental_rerun", None)
+    or (lambda: None)
+)
+
 
 def st_rerun() -> None:
-    rerun = getattr(st, "rerun", None)
-    if callable(rerun):
-        rerun()
-        return
-    legacy = getattr(st, "experimental_rerun", None)
-    if callable(legacy):
-        legacy()
+    _RERUN()
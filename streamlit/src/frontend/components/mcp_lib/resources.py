@@ -0,0 +1,198 @@
+"""Cached web3 resources shared across MCP page reruns."""
+
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import streamlit as st
+from web3 import Web3
+from web3.contract import Contract
+
+from ..config import (
+    ARC_RPC_ENV,
+    GAS_LIMIT_ENV,
+    GAS_PRICE_GWEI_ENV,
+    LENDING_POOL_ABI_PATH_ENV,
+    LENDING_POOL_ADDRESS_ENV,
+    PRIVATE_KEY_ENV,
+    SBT_ADDRESS_ENV,
+    TRUSTMINT_SBT_ABI_PATH_ENV,
+    USDC_ABI_PATH_ENV,
+    USDC_ADDRESS_ENV,
+    USDC_DECIMALS_ENV,
+    get_sbt_address,
+)
+from ..toolkit import build_lending_pool_toolkit, build_llm_toolkit, build_sbt_guard
+from ..web3_utils import get_web3_client, load_contract_abi
+
+# (tools_schema, function_map, schema_by_name)
+Toolkit = Tuple[
+    list[Dict[str, Any]], Dict[str, Callable[..., str]], Dict[str, Dict[str, Any]]
+]
+
+
+@dataclass(frozen=True)
+class EnvConfig:
+    """Environment settings read by the MCP tools page."""
+
+    rpc_url: Optional[str]
+    private_key: Optional[str]
+    lender_pk: Optional[str]
+    borrower_pk: Optional[str]
+    default_gas_limit: int
+    gas_price_gwei: str
+    sbt_address: Optional[str]
+    sbt_env_name: str
+    sbt_abi_path: Optional[str]
+    pool_address: Optional[str]
+    pool_abi_path: Optional[str]
+    usdc_address: Optional[str]
+    usdc_abi_path: Optional[str]
+    usdc_decimals: int
+
+
+@st.cache_resource(show_spinner=False)
+def env_config() -> EnvConfig:
+    """Read the MCP page settings from the environment once per process."""
+
+    sbt_address, sbt_env_name = get_sbt_address()
+    return EnvConfig(
+        rpc_url=os.getenv(ARC_RPC_ENV),
+        private_key=os.getenv(PRIVATE_KEY_ENV),
+        lender_pk=os.getenv("LENDER_PRIVATE_KEY"),
+        borrower_pk=os.getenv("BORROWER_PRIVATE_KEY"),
+        default_gas_limit=int(os.getenv(GAS_LIMIT_ENV, "200000")),
+        gas_price_gwei=os.getenv(GAS_PRICE_GWEI_ENV, "1"),
+        sbt_address=sbt_address,
+        sbt_env_name=sbt_env_name or SBT_ADDRESS_ENV,
+        sbt_abi_path=os.getenv(TRUSTMINT_SBT_ABI_PATH_ENV),
+        pool_address=os.getenv(LENDING_POOL_ADDRESS_ENV),
+        pool_abi_path=os.getenv(LENDING_POOL_ABI_PATH_ENV),
+        usdc_address=os.getenv(USDC_ADDRESS_ENV),
+        usdc_abi_path=os.getenv(USDC_ABI_PATH_ENV),
+        usdc_decimals=int(os.getenv(USDC_DECIMALS_ENV, "6")),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def cached_abi(abi_path: str) -> Optional[list[dict[str, Any]]]:
+    """Parse an ABI file once per path; the result is shared read-only."""
+
+    return load_contract_abi(abi_path)
+
+
+@st.cache_resource(show_spinner=False)
+def _cached_web3(rpc_url: str) -> Web3:
+    w3 = get_web3_client(rpc_url)
+    if w3 is None:
+        # Raise instead of returning None so an outage is not cached.
+        raise ConnectionError(f"Unable to reach RPC endpoint {rpc_url}")
+    return w3
+
+
+def cached_web3(rpc_url: Optional[str]) -> Optional[Web3]:
+    """Return the shared Web3 client for ``rpc_url`` or None if unreachable."""
+
+    if not rpc_url:
+        return None
+    try:
+        return _cached_web3(rpc_url)
+    except ConnectionError:
+        return None
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _cached_chain_id(rpc_url: str) -> int:
+    return int(_cached_web3(rpc_url).eth.chain_id)
+
+
+def cached_chain_id(rpc_url: Optional[str]) -> Optional[int]:
+    """Chain ID for ``rpc_url``, fetched at most once an hour."""
+
+    if not rpc_url:
+        return None
+    try:
+        return _cached_chain_id(rpc_url)
+    except Exception:
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def cached_contract(rpc_url: str, address: str, abi_path: str) -> Contract:
+    """Bind ``address`` to the ABI at ``abi_path`` once per RPC endpoint."""
+
+    return _cached_web3(rpc_url).eth.contract(
+        address=Web3.to_checksum_address(address), abi=cached_abi(abi_path)
+    )
+
+
+def _schema_index(tools_schema: list[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    return {entry["function"]["name"]: entry for entry in tools_schema}
+
+
+@st.cache_resource(show_spinner=False)
+def cached_sbt_guard(rpc_url: str, address: str, abi_path: str) -> Callable[..., Any]:
+    return build_sbt_guard(
+        _cached_web3(rpc_url), cached_contract(rpc_url, address, abi_path)
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def cached_sbt_toolkit(
+    rpc_url: str,
+    address: str,
+    abi_path: str,
+    default_gas_limit: int,
+    gas_price_gwei: str,
+    private_key: Optional[str],
+) -> Toolkit:
+    tools_schema, function_map = build_llm_toolkit(
+        w3=_cached_web3(rpc_url),
+        contract=cached_contract(rpc_url, address, abi_path),
+        token_decimals=0,
+        private_key=private_key,
+        default_gas_limit=default_gas_limit,
+        gas_price_gwei=gas_price_gwei,
+    )
+    return tools_schema, function_map, _schema_index(tools_schema)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def cached_pool_toolkit(
+    rpc_url: str,
+    address: str,
+    abi_path: str,
+    token_decimals: int,
+    default_gas_limit: int,
+    gas_price_gwei: str,
+    private_key: Optional[str],
+    role_addresses: Tuple[Tuple[str, str], ...],
+    role_private_keys: Tuple[Tuple[str, Optional[str]], ...],
+    sbt_source: Optional[Tuple[str, str]] = None,
+) -> Toolkit:
+    """Build the LendingPool toolkit once per configuration.
+
+    Role mappings are passed as item tuples so they hash; the toolkit gets its
+    own dict copies rather than a reference into any one session's state.
+    ``sbt_source`` is ``(address, abi_path)`` of the SBT used as borrower guard.
+    Every role assignment makes a new key, and each entry holds signer keys,
+    so the cache is bounded.
+    """
+
+    tools_schema, function_map = build_lending_pool_toolkit(
+        w3=_cached_web3(rpc_url),
+        pool_contract=cached_contract(rpc_url, address, abi_path),
+        token_decimals=token_decimals,
+        native_decimals=18,
+        private_key=private_key,
+        default_gas_limit=default_gas_limit,
+        gas_price_gwei=gas_price_gwei,
+        role_addresses=dict(role_addresses),
+        role_private_keys=dict(role_private_keys),
+        borrower_guard=(
+            cached_sbt_guard(rpc_url, *sbt_source) if sbt_source else None
+        ),
+    )
+    return tools_schema, function_map, _schema_index(tools_schema)
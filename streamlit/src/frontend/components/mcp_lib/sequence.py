@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from itertools import count
+from time import time
+from typing import Iterator
+
+import streamlit as st
+
+_SEQUENCE_KEY = "mcp_command_sequence"
+
+
+def next_command_sequence() -> int:
+    """Return a strictly increasing MetaMask command sequence for this session.
+
+    The counter is seeded from the wall clock once, so values stay above the
+    timestamp-based sequences the wallet component may already have seen.
+    """
+
+    counter: Iterator[int] | None = st.session_state.get(_SEQUENCE_KEY)
+    if counter is None:
+        counter = count(int(time() * 1000))
+        st.session_state[_SEQUENCE_KEY] = counter
+    return next(counter)
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import json
-from time import time
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional
 
 import streamlit as st
 from web3 import Web3
 
 from ..session import DEFAULT_SESSION_KEY
+from ..toolkit_lib.tx_helpers import chain_id_for
 from ..wallet_connect_component import wallet_command
 from .logging_utils import get_metamask_logger
+from .formatting import pretty_json
 from .rerun import st_rerun
+from .sequence import next_command_sequence
 from .wallet_section import render_wallet_section
 
 
@@ -36,6 +39,36 @@ def _normalise_chain_id(value: Any) -> Optional[int]:
     return None
 
 
+@lru_cache(maxsize=16)
+def _selection_map(
+    tool_names: tuple[str, ...], role_items: tuple[tuple[str, str], ...]
+) -> Dict[str, str]:
+    """Map selectbox labels to tool names, tagging tools that need a signer.
+
+    The result is shared between reruns; treat it as read-only.
+    """
+
+    roles = dict(role_items)
+    selection_map: Dict[str, str] = {}
+    for name in tool_names:
+        role_label = roles.get(name)
+        if role_label and role_label != "Read-only":
+            selection_map[f"{name} [{role_label}]"] = name
+        else:
+            selection_map[name] = name
+    return selection_map
+
+
+def _render_tool_result(parsed: Any) -> None:
+    try:
+        if isinstance(parsed, (list, dict)):
+            st.code(pretty_json(parsed), language="json")
+        else:
+            st.write(parsed)
+    except Exception:
+        st.write(parsed if isinstance(parsed, str) else json.dumps(parsed))
+
+
 def render_tool_runner(
     tools_schema: list[Dict[str, Any]],
     function_map: Dict[str, Callable[..., str]],
@@ -46,6 +79,7 @@ def render_tool_runner(
     role_private_keys: Dict[str, Optional[str]] | None = None,
     role_addresses: Dict[str, str] | None = None,
     tool_role_map: Dict[str, str] | None = None,
+    schema_by_name: Dict[str, Dict[str, Any]] | None = None,
 ) -> None:
     st.subheader("Run a tool")
 
@@ -53,17 +87,12 @@ def render_tool_runner(
         st.info("No MCP tools available. Check contract addresses and ABI paths.")
         return
 
-    tool_names = [entry["function"]["name"] for entry in tools_schema]
-    display_names = []
-    for name in tool_names:
-        role_label = (tool_role_map or {}).get(name)
-        if role_label and role_label != "Read-only":
-            display_names.append(f"{name} [{role_label}]")
-        else:
-            display_names.append(name)
-    selection_map = dict(zip(display_names, tool_names))
+    if schema_by_name is None:
+        schema_by_name = {entry["function"]["name"]: entry for entry in tools_schema}
+    tool_names = tuple(schema_by_name)
+    selection_map = _selection_map(tool_names, tuple((tool_role_map or {}).items()))
     selected_display = st.selectbox(
-        "Choose a tool", display_names, key=f"{key_prefix}_tool_select"
+        "Choose a tool", tuple(selection_map), key=f"{key_prefix}_tool_select"
     )
     selected = selection_map[selected_display]
 
@@ -95,7 +124,7 @@ def render_tool_runner(
 
     mm_state_key = f"mm_state_{key_prefix}_{selected}"
     try:
-        expected_chain_id = _normalise_chain_id(w3.eth.chain_id)
+        expected_chain_id = _normalise_chain_id(chain_id_for(w3))
     except Exception:
         expected_chain_id = None
 
@@ -153,13 +182,11 @@ def render_tool_runner(
             if isinstance(last_value, dict):
                 mm_state_chain_id = _normalise_chain_id(last_value.get("chainId"))
 
-    session_chain_id: Optional[int] = None
-    cached_wallet = st.session_state.get(DEFAULT_SESSION_KEY)
-    if isinstance(cached_wallet, dict):
-        session_chain_id = _normalise_chain_id(cached_wallet.get("chainId"))
-        preferred_address = cached_wallet.get("address")
-    else:
-        preferred_address = None
+    session_wallet = st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
+    if not isinstance(session_wallet, dict):
+        session_wallet = {}
+    session_chain_id = _normalise_chain_id(session_wallet.get("chainId"))
+    preferred_address = session_wallet.get("address")
 
     current_chain_id = mm_state_chain_id or session_chain_id
     auto_switch_state_key = f"mm_auto_switch_{key_prefix}_{selected}"
@@ -185,9 +212,7 @@ def render_tool_runner(
             current_chain_id = payload_chain
             mm_state["wallet_chain"] = payload_chain
             st.session_state[mm_state_key] = mm_state
-            st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-            if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                st.session_state[DEFAULT_SESSION_KEY]["chainId"] = payload_chain
+            session_wallet["chainId"] = payload_chain
         if payload_error:
             _append_log(f"✖ MetaMask error: {payload_error}")
         elif payload_warning:
@@ -213,9 +238,7 @@ def render_tool_runner(
             connected_address = str(candidate_address)
             mm_state["wallet_address"] = connected_address
             st.session_state[mm_state_key] = mm_state
-            st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-            if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                st.session_state[DEFAULT_SESSION_KEY]["address"] = connected_address
+            session_wallet["address"] = connected_address
     wallet_connected = bool(connected_address)
 
     auto_connect_state_key = f"mm_auto_connect_{key_prefix}_{selected}"
@@ -245,7 +268,7 @@ def render_tool_runner(
         )
         if not pending_connect:
             if st.button("Connect MetaMask", key=connect_button_key):
-                connect_sequence = int(time() * 1000)
+                connect_sequence = next_command_sequence()
                 reason = (
                     f"role '{required_role}' requires MetaMask signer"
                     if required_role
@@ -301,16 +324,12 @@ def render_tool_runner(
                 wallet_connected = True
                 mm_state["wallet_address"] = connected_address
                 st.session_state[mm_state_key] = mm_state
-                st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-                if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                    st.session_state[DEFAULT_SESSION_KEY]["address"] = connected_address
+                session_wallet["address"] = connected_address
             if payload_chain is not None:
                 current_chain_id = payload_chain
                 mm_state["wallet_chain"] = payload_chain
                 st.session_state[mm_state_key] = mm_state
-                st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-                if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                    st.session_state[DEFAULT_SESSION_KEY]["chainId"] = payload_chain
+                session_wallet["chainId"] = payload_chain
             if payload_error:
                 _append_log(f"✖ MetaMask connection error: {payload_error}")
             elif payload_status == "connected":
@@ -363,7 +382,7 @@ def render_tool_runner(
         )
         if not pending_switch:
             if st.button("Switch MetaMask to ARC", key=switch_button_key):
-                switch_sequence = int(time() * 1000)
+                switch_sequence = next_command_sequence()
                 reason = (
                     f"wallet on chain {current_chain_id}; expected {expected_chain_id}"
                     if expected_chain_id is not None and current_chain_id is not None
@@ -417,9 +436,7 @@ def render_tool_runner(
                     current_chain_id = result_chain
                     mm_state["wallet_chain"] = result_chain
                     st.session_state[mm_state_key] = mm_state
-                    st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-                    if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                        st.session_state[DEFAULT_SESSION_KEY]["chainId"] = result_chain
+                    session_wallet["chainId"] = result_chain
                 status_msg = switch_payload.get("status")
                 error_msg = switch_payload.get("error")
                 if result_chain == expected_chain_id:
@@ -474,50 +491,56 @@ def render_tool_runner(
             st_rerun()
         return
 
-    schema = next(item for item in tools_schema if item["function"]["name"] == selected)
+    schema = schema_by_name[selected]
     parameters = schema["function"].get("parameters", {})
     props = parameters.get("properties", {})
     required = set(parameters.get("required", []))
 
     inputs: Dict[str, Any] = {}
-    for name, details in props.items():
-        field_type = details.get("type", "string")
-        label = f"{name} ({field_type})"
-        default = details.get("default")
-        if parameter_defaults:
-            default = parameter_defaults.get(selected, {}).get(name, default)
-
-        widget_key = f"{key_prefix}_param_{selected}_{name}"
-        if field_type == "integer":
-            value = st.number_input(
-                label, value=int(default or 0), step=1, key=widget_key
-            )
-            inputs[name] = int(value)
-        elif field_type == "number":
-            value = st.number_input(label, value=float(default or 0), key=widget_key)
-            inputs[name] = float(value)
-        elif field_type == "boolean":
-            inputs[name] = st.checkbox(
-                label,
-                value=bool(default) if default is not None else False,
-                key=widget_key,
-            )
-        elif field_type == "array":
-            raw = st.text_area(
-                f"{label} (comma separated)",
-                value=", ".join(default or []) if isinstance(default, list) else "",
-                key=widget_key,
-            )
-            inputs[name] = [item.strip() for item in raw.split(",") if item.strip()]
-        else:
-            inputs[name] = st.text_input(
-                label,
-                value=str(default) if default is not None else "",
-                key=widget_key,
-            )
-
     disable_run = chain_mismatch or (requires_metamask_wallet and not wallet_connected)
-    if st.button("Run MCP tool", key=f"{key_prefix}_run_tool", disabled=disable_run):
+    # One rerun on submit instead of one per parameter edit.
+    with st.form(key=f"{key_prefix}_{selected}_form"):
+        for name, details in props.items():
+            field_type = details.get("type", "string")
+            label = f"{name} ({field_type})"
+            default = details.get("default")
+            if parameter_defaults:
+                default = parameter_defaults.get(selected, {}).get(name, default)
+
+            widget_key = f"{key_prefix}_param_{selected}_{name}"
+            if field_type == "integer":
+                value = st.number_input(
+                    label, value=int(default or 0), step=1, key=widget_key
+                )
+                inputs[name] = int(value)
+            elif field_type == "number":
+                value = st.number_input(
+                    label, value=float(default or 0), key=widget_key
+                )
+                inputs[name] = float(value)
+            elif field_type == "boolean":
+                inputs[name] = st.checkbox(
+                    label,
+                    value=bool(default) if default is not None else False,
+                    key=widget_key,
+                )
+            elif field_type == "array":
+                raw = st.text_area(
+                    f"{label} (comma separated)",
+                    value=", ".join(default or []) if isinstance(default, list) else "",
+                    key=widget_key,
+                )
+                inputs[name] = [item.strip() for item in raw.split(",") if item.strip()]
+            else:
+                inputs[name] = st.text_input(
+                    label,
+                    value=str(default) if default is not None else "",
+                    key=widget_key,
+                )
+        submitted = st.form_submit_button("Run MCP tool", disabled=disable_run)
+
+    result_key = f"tool_result_{key_prefix}_{selected}"
+    if submitted:
         if requires_metamask_wallet and not wallet_connected:
             st.error(
                 "Connect your MetaMask wallet on the ARC network before running this tool."
@@ -560,6 +583,14 @@ def render_tool_runner(
             and isinstance(parsed.get("metamask"), dict)
         ):
             mm = parsed["metamask"]
+            tx_request = mm.get("tx_request")
+            if isinstance(tx_request, str):
+                # Parse once here; the wallet section reruns against the dict.
+                try:
+                    mm["tx_request"] = json.loads(tx_request)
+                except json.JSONDecodeError:
+                    st.warning("Tool provided tx_request that is not valid JSON.")
+                    mm["tx_request"] = None
             state_key = f"mm_state_{key_prefix}_{selected}"
             mm_state = (
                 st.session_state.get(state_key, {})
@@ -572,10 +603,8 @@ def render_tool_runner(
             render_wallet_section(mm_state, w3, key_prefix, selected)
             st.stop()
 
-        try:
-            if isinstance(parsed, (list, dict)):
-                st.json(parsed)
-            else:
-                st.write(parsed)
-        except Exception:
-            st.write(result if isinstance(result, str) else json.dumps(result))
+        st.session_state[result_key] = parsed
+
+    # Show the latest result on later reruns without calling the handler again.
+    if result_key in st.session_state:
+        _render_tool_result(st.session_state[result_key])
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
-import json
-from time import time
 from typing import Any, Dict, Optional
 
 import streamlit as st
 from web3 import Web3
+from web3.exceptions import TransactionNotFound
 
 from ..session import DEFAULT_SESSION_KEY
 from ..wallet_connect_component import wallet_command
 from .logging_utils import get_metamask_logger
+from .formatting import pretty_json
 from .rerun import st_rerun
+from .sequence import next_command_sequence
 
 
 METAMASK_LOGGER = get_metamask_logger()
+RECEIPTS_KEY = "mcp_tx_receipts"
 
 
 def _normalise_chain_id(value: Any) -> Optional[int]:
@@ -35,17 +37,51 @@ def _normalise_chain_id(value: Any) -> Optional[int]:
     return None
 
 
+@st.cache_data(ttl=5, show_spinner=False)
+def _try_receipt(_w3: Web3, tx_hash: str) -> Optional[Dict[str, Any]]:
+    """Return the JSON-ready receipt summary, or None while still pending."""
+
+    try:
+        receipt = _w3.eth.get_transaction_receipt(tx_hash)
+    except TransactionNotFound:
+        return None
+    receipt_hash = receipt.get("transactionHash")
+    return {
+        "transactionHash": receipt_hash.hex() if receipt_hash else tx_hash,
+        "status": receipt.get("status"),
+        "blockNumber": receipt.get("blockNumber"),
+        "gasUsed": receipt.get("gasUsed"),
+        "cumulativeGasUsed": receipt.get("cumulativeGasUsed"),
+    }
+
+
+def _render_receipt(receipt: Dict[str, Any]) -> None:
+    st.caption("Transaction receipt")
+    st.code(pretty_json(receipt), language="json")
+
+
+@st.fragment(run_every=3)
+def _poll_receipt(w3: Web3, tx_hash: str) -> None:
+    """Poll for the receipt without blocking the script until it is mined."""
+
+    try:
+        receipt = _try_receipt(w3, tx_hash)
+    except Exception as exc:
+        st.warning(f"Unable to fetch receipt yet: {exc}")
+        return
+    if receipt is None:
+        st.caption("⏳ Waiting for receipt…")
+        return
+    st.session_state.setdefault(RECEIPTS_KEY, {})[tx_hash] = receipt
+    # Full rerun renders the stored receipt and drops this polling fragment.
+    st_rerun()
+
+
 def render_wallet_section(
     mm_state: Dict[str, Any], w3: Web3, key_prefix: str, selected: str
 ) -> None:
     mm_payload = mm_state.get("metamask", {})
     tx_req = mm_payload.get("tx_request")
-    if isinstance(tx_req, str):
-        try:
-            tx_req = json.loads(tx_req)
-        except json.JSONDecodeError:
-            st.warning("Tool provided tx_request that is not valid JSON.")
-            tx_req = None
     action = mm_payload.get("action") or "eth_sendTransaction"
     from_address = mm_payload.get("from")
     chain_id = mm_payload.get("chainId")
@@ -54,8 +90,10 @@ def render_wallet_section(
             "Chain ID not provided by tool; ensure your wallet is connected to the correct network."
         )
 
-    cached = st.session_state.get(DEFAULT_SESSION_KEY, {})
-    preferred_address = cached.get("address") if isinstance(cached, dict) else None
+    session_wallet = st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
+    if not isinstance(session_wallet, dict):
+        session_wallet = {}
+    preferred_address = session_wallet.get("address")
     if from_address:
         preferred_address = from_address
         mm_state.setdefault("wallet_address", from_address)
@@ -85,7 +123,6 @@ def render_wallet_section(
         st.session_state[f"mm_state_{key_prefix}_{selected}"] = mm_state
     component_key = f"wallet_headless_{key_prefix}_{selected}"
     command = pending.get("command") if isinstance(pending, dict) else None
-    command_payload = pending.get("payload") if isinstance(pending, dict) else None
     command_sequence = pending.get("sequence") if isinstance(pending, dict) else None
 
     command_payload = {"tx_request": tx_req, "action": action}
@@ -127,11 +164,9 @@ def render_wallet_section(
     required_chain_id = _normalise_chain_id(chain_id)
     wallet_chain_id = _normalise_chain_id(mm_state.get("wallet_chain"))
     if wallet_chain_id is None:
-        cached_wallet = st.session_state.get(DEFAULT_SESSION_KEY, {})
-        if isinstance(cached_wallet, dict):
-            wallet_chain_id = _normalise_chain_id(cached_wallet.get("chainId"))
-            if wallet_chain_id is not None:
-                mm_state["wallet_chain"] = wallet_chain_id
+        wallet_chain_id = _normalise_chain_id(session_wallet.get("chainId"))
+        if wallet_chain_id is not None:
+            mm_state["wallet_chain"] = wallet_chain_id
 
     chain_mismatch = (
         required_chain_id is not None
@@ -146,7 +181,7 @@ def render_wallet_section(
             and pending is None
             and not auto_switch_attempted
         ):
-            sequence = int(time() * 1000)
+            sequence = next_command_sequence()
             mm_state["pending_command"] = {
                 "command": "switch_network",
                 "payload": {"require_chain_id": required_chain_id},
@@ -193,7 +228,7 @@ def render_wallet_section(
         mm_state["pending_command"] = {
             "command": "connect",
             "payload": {},
-            "sequence": int(time() * 1000),
+            "sequence": next_command_sequence(),
             "reason": "user clicked Connect wallet button",
             "logged": False,
         }
@@ -209,7 +244,7 @@ def render_wallet_section(
         mm_state["pending_command"] = {
             "command": "switch_network",
             "payload": {"require_chain_id": chain_id},
-            "sequence": int(time() * 1000),
+            "sequence": next_command_sequence(),
             "reason": f"user requested switch to chain {chain_id}",
             "logged": False,
         }
@@ -230,7 +265,7 @@ def render_wallet_section(
         mm_state["pending_command"] = {
             "command": "send_transaction",
             "payload": {"tx_request": tx_req, "action": action},
-            "sequence": int(time() * 1000),
+            "sequence": next_command_sequence(),
             "reason": "user clicked Send transaction button",
             "logged": False,
         }
@@ -250,13 +285,9 @@ def render_wallet_section(
         addr_for_session = last_result.get("address") or mm_state.get("wallet_address")
         chain_for_session = last_result.get("chainId") or mm_state.get("wallet_chain")
         if addr_for_session:
-            st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-            if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                st.session_state[DEFAULT_SESSION_KEY]["address"] = addr_for_session
+            session_wallet["address"] = addr_for_session
         if chain_for_session:
-            st.session_state.setdefault(DEFAULT_SESSION_KEY, {})
-            if isinstance(st.session_state[DEFAULT_SESSION_KEY], dict):
-                st.session_state[DEFAULT_SESSION_KEY]["chainId"] = chain_for_session
+            session_wallet["chainId"] = chain_for_session
         if error_msg:
             st.error(f"MetaMask command failed: {error_msg}")
         else:
@@ -269,29 +300,15 @@ def render_wallet_section(
                     f"[View on Arcscan]({explorer_url})",
                     help="Opens Arcscan for the transaction",
                 )
-                with st.spinner("Waiting for receipt…"):
-                    try:
-                        receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-                        st.caption("Transaction receipt")
-                        st.json(
-                            {
-                                "transactionHash": (
-                                    receipt.get("transactionHash").hex()
-                                    if receipt.get("transactionHash")
-                                    else tx_hash
-                                ),
-                                "status": receipt.get("status"),
-                                "blockNumber": receipt.get("blockNumber"),
-                                "gasUsed": receipt.get("gasUsed"),
-                                "cumulativeGasUsed": receipt.get("cumulativeGasUsed"),
-                            }
-                        )
-                    except Exception as exc:
-                        st.warning(f"Unable to fetch receipt yet: {exc}")
+                receipt = st.session_state.setdefault(RECEIPTS_KEY, {}).get(tx_hash)
+                if receipt is None:
+                    _poll_receipt(w3, tx_hash)
+                else:
+                    _render_receipt(receipt)
 
     with st.expander("Transaction request", expanded=False):
         if tx_req is not None:
-            st.json(tx_req)
+            st.code(pretty_json(tx_req), language="json")
         else:
             st.write("(none)")
 
@@ -7,15 +7,23 @@ organized into smaller modules.
 
 from __future__ import annotations
 
-from .toolkit_lib.messages import tool_success, tool_error, render_tool_message
+from .toolkit_lib.messages import (
+    tool_success,
+    tool_error,
+    render_tool_message,
+    render_tool_messages,
+)
 from .toolkit_lib.history import render_llm_history
 from .toolkit_lib.sbt_tools import build_llm_toolkit, build_sbt_guard
 from .toolkit_lib.pool_tools import build_lending_pool_toolkit
 from .toolkit_lib.bridge_tools import build_bridge_toolkit
 from .toolkit_lib.tx_helpers import (
+    chain_id_for,
     fee_params,
     next_nonce,
     sign_and_send,
+    sign_and_broadcast,
+    tx_status,
     format_receipt,
     metamask_tx_request,
 )
@@ -24,14 +32,18 @@ __all__ = [
     "tool_success",
     "tool_error",
     "render_tool_message",
+    "render_tool_messages",
     "render_llm_history",
     "build_llm_toolkit",
     "build_sbt_guard",
     "build_lending_pool_toolkit",
     "build_bridge_toolkit",
+    "chain_id_for",
     "fee_params",
     "next_nonce",
     "sign_and_send",
+    "sign_and_broadcast",
+    "tx_status",
     "format_receipt",
     "metamask_tx_request",
 ]
@@ -39,6 +39,7 @@ from ..config import (
     GAS_PRICE_GWEI_ENV,
 )
 from ..toolkit_lib.messages import tool_error, tool_success
+from ..toolkit_lib.tx_helpers import chain_id_for
 from ..mcp_lib.constants import (
     MCP_BORROWER_BRIDGE_SESSION_KEY,
     ATTESTATION_POLL_INTERVAL,
@@ -111,7 +112,7 @@ def build_borrower_bridge_toolkit() -> Tuple[List[Dict[str, Any]], Dict[str, Any
 
         try:
             w3 = _init_web3(arc_rpc_url)
-            chain_id = w3.eth.chain_id
+            chain_id = chain_id_for(w3)
         except BridgeError as exc:
             return tool_error(str(exc))
 
@@ -1,22 +1,47 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, List, Tuple
 
 import streamlit as st
 
-from .messages import render_tool_message, _render_user_message
+from .messages import render_tool_messages, _render_user_message
 
 
 def render_llm_history(messages: Iterable[Dict[str, Any]]) -> None:
+    """Render chat history, fusing consecutive assistant and tool messages.
+
+    Each run of assistant replies shares one chat bubble and one markdown
+    call, and each run of tool outputs shares one bubble, which keeps the
+    number of frontend deltas per rerun down on long conversations.
+    """
+    assistant_parts: List[str] = []
+    tool_outputs: List[Tuple[str, str]] = []
+
+    def flush() -> None:
+        if assistant_parts:
+            with st.chat_message("assistant"):
+                st.markdown("\n\n---\n\n".join(assistant_parts))
+            assistant_parts.clear()
+        if tool_outputs:
+            render_tool_messages(tool_outputs)
+            tool_outputs.clear()
+
     for message in messages:
         role = message.get("role")
         content = message.get("content")
         if role == "system":
             continue
-        if role == "user":
-            _render_user_message(content or "")
-        elif role == "assistant":
-            with st.chat_message("assistant"):
-                st.markdown(content or "")
+        if role == "assistant":
+            if tool_outputs:
+                flush()
+            # Tool-call-only turns carry no text; skip the empty bubble.
+            if content:
+                assistant_parts.append(content)
         elif role == "tool":
-            render_tool_message(message.get("name", "tool"), content or "")
+            if assistant_parts:
+                flush()
+            tool_outputs.append((message.get("name", "tool"), content or ""))
+        elif role == "user":
+            flush()
+            _render_user_message(content or "")
+    flush()
@@ -2,72 +2,107 @@ from __future__ import annotations
 
 import json
 import os
-from decimal import Decimal
-from typing import Any, Dict
+import re
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Tuple
 
+import orjson
 import streamlit as st
 
+_ATTACH_MARK = "[Attached documents]"
+_ATTACH_SECTION_RE = re.compile(r"(?m)^###\s*")
+
 
 def tool_success(payload: Dict[str, Any]) -> str:
-    return json.dumps({"success": True, **payload}, default=_json_default)
+    return _dumps({"success": True, **payload})
 
 
 def tool_error(message: str, **extras: Any) -> str:
-    return json.dumps(
-        {"success": False, "error": message, **extras}, default=_json_default
-    )
+    return _dumps({"success": False, "error": message, **extras})
+
+
+def _dumps(value: Any) -> str:
+    try:
+        return orjson.dumps(value, default=_json_default).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects ints wider than 64 bits (e.g. uint256 wei amounts).
+        return json.dumps(value, default=_json_default)
 
 
 def _json_default(value: Any) -> Any:
-    if isinstance(value, Decimal):
-        return str(value)
-    return value
+    return str(value)
 
 
 def render_tool_message(tool_name: str, content: str) -> None:
+    render_tool_messages([(tool_name, content)])
+
+
+def render_tool_messages(outputs: Iterable[Tuple[str, str]]) -> None:
+    """Render a round of tool outputs inside a single assistant message."""
+
+    outputs = list(outputs)
+    if not outputs:
+        return
     with st.chat_message("assistant"):
-        expander_title = f"Tool `{tool_name}` output"
-        st.markdown(f"✅ Tool `{tool_name}` completed. Expand below to review details.")
-
-        show_button = False
-        button_label = "Approve Transaction"
-        parsed_response: Any = None
-
-        try:
-            parsed_response = json.loads(content)
-            if isinstance(parsed_response, dict) and parsed_response.get("show_button"):
-                show_button = True
-                button_label = parsed_response.get(
-                    "button_label", "Approve Transaction"
-                )
-        except Exception:
-            parsed_response = None
+        for tool_name, content in outputs:
+            _render_tool_output(tool_name, content)
 
-        if show_button:
-            st.warning("Action required: expand the panel to approve this step.")
 
-        with st.expander(expander_title, expanded=False):
-            _render_tool_content(content)
+def _render_tool_output(tool_name: str, content: str) -> None:
+    expander_title = f"Tool `{tool_name}` output"
+    st.markdown(f"✅ Tool `{tool_name}` completed. Expand below to review details.")
+
+    show_button = False
+    button_label = "Approve Transaction"
 
-            if show_button:
-                button_key = f"tx_button_{tool_name}_{hash(content)}"
-                if st.button(f"🔐 {button_label}", key=button_key, type="primary"):
-                    pending = st.session_state.get("chatbot_wallet_pending_command")
-                    if isinstance(pending, dict):
-                        pending["triggered"] = True
-                        pending.pop("headless_executed", None)
-                        st.session_state["chatbot_wallet_pending_command"] = pending
-                    st.session_state["chatbot_wallet_button_triggered"] = button_key
-                    st.rerun()
+    parsed_response = _parse_tool_json(content)
+    if isinstance(parsed_response, dict) and parsed_response.get("show_button"):
+        show_button = True
+        button_label = parsed_response.get("button_label", "Approve Transaction")
+
+    if show_button:
+        st.warning("Action required: expand the panel to approve this step.")
+
+    with st.expander(expander_title, expanded=False):
+        _render_tool_content(content)
+
+        if show_button:
+            button_key = f"tx_button_{tool_name}_{hash(content)}"
+            if st.button(f"🔐 {button_label}", key=button_key, type="primary"):
+                pending = st.session_state.get("chatbot_wallet_pending_command")
+                if isinstance(pending, dict):
+                    pending["triggered"] = True
+                    pending.pop("headless_executed", None)
+                    st.session_state["chatbot_wallet_pending_command"] = pending
+                st.session_state["chatbot_wallet_button_triggered"] = button_key
+                st.rerun()
+
+
+_NOT_JSON = object()
+
+
+@lru_cache(maxsize=256)
+def _parse_tool_json(content: str) -> Any:
+    """Parsed tool output, memoized across reruns; ``_NOT_JSON`` if not JSON.
+
+    Callers must treat the result as read-only since it is shared.
+    """
+    head = content.lstrip()[:1] if isinstance(content, str) else ""
+    if not head or head not in '[{"':
+        # Plain-text/markdown output: skip the raise-and-catch of a failed parse.
+        return _NOT_JSON
+    try:
+        return orjson.loads(content)
+    except (TypeError, ValueError):
+        return _NOT_JSON
 
 
 def _render_tool_content(content: str) -> None:
     if not content:
         st.write("(no content returned)")
         return
-    try:
-        parsed = json.loads(content)
-    except json.JSONDecodeError:
+    parsed = _parse_tool_json(content)
+    if parsed is _NOT_JSON:
         st.markdown(content)
         return
     if isinstance(parsed, (list, dict)):
@@ -76,31 +111,32 @@ def _render_tool_content(content: str) -> None:
         st.write(parsed)
 
 
+@lru_cache(maxsize=1)
+def _preview_max_chars() -> int:
+    return int(os.getenv("CHAT_PREVIEW_MAX_CHARS", "1000"))
+
+
 def _render_user_message(content: str) -> None:
     with st.chat_message("user"):
-        if content and "[Attached documents]" in content:
-            pre, attach_block = content.split("[Attached documents]", 1)
+        pre, mark, attach_block = (content or "").partition(_ATTACH_MARK)
+        if mark:
             st.markdown(pre.strip())
-            import re
-
-            preview_chars = int(os.getenv("CHAT_PREVIEW_MAX_CHARS", "1000"))
-            sections = re.split(r"(?m)^###\s*", attach_block)
+            preview_chars = _preview_max_chars()
+            sections = _ATTACH_SECTION_RE.split(attach_block)
             if len(sections) > 1:
                 with st.expander("Attached documents (truncated preview)"):
+                    parts = []
                     for seg in sections:
                         seg = seg.strip()
                         if not seg:
                             continue
-                        name_end = seg.find("\n")
-                        if name_end == -1:
-                            name = seg
-                            body = ""
-                        else:
-                            name = seg[:name_end].strip()
-                            body = seg[name_end + 1 :].strip()
-                        trunc = body[:preview_chars]
+                        name, _, body = seg.partition("\n")
+                        body = body.strip()
                         ellipsis = "…" if len(body) > preview_chars else ""
-                        st.markdown(f"**{name}**\n\n{trunc}{ellipsis}")
+                        parts.append(
+                            f"**{name.strip()}**\n\n{body[:preview_chars]}{ellipsis}"
+                        )
+                    st.markdown("\n\n---\n\n".join(parts))
             else:
                 with st.expander("Attached documents"):
                     st.markdown("(preview unavailable)")
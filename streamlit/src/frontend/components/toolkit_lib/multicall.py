@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple, Union
+
+from web3 import Web3
+from web3.contract import Contract
+
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+
+_AGGREGATE3_ABI = [
+    {
+        "name": "aggregate3",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "allowFailure", "type": "bool"},
+                    {"name": "callData", "type": "bytes"},
+                ],
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"},
+                ],
+            }
+        ],
+    }
+]
+
+
+@lru_cache(maxsize=8)
+def _multicall3_contract(w3: Web3) -> Optional[Contract]:
+    """Multicall3 at its canonical address, or None when it is not deployed.
+
+    RPC errors propagate so that lru_cache only keeps a confirmed answer.
+    """
+    if not w3.eth.get_code(MULTICALL3_ADDRESS):
+        return None
+    return w3.eth.contract(address=MULTICALL3_ADDRESS, abi=_AGGREGATE3_ABI)
+
+
+def multicall3(
+    w3: Web3, calls: Sequence[Tuple[str, Union[str, bytes]]]
+) -> Optional[List[Tuple[bool, bytes]]]:
+    """Run ``(target, calldata)`` pairs in one eth_call via aggregate3.
+
+    Every call is allowed to fail individually. Returns None when Multicall3
+    is unavailable so callers can fall back to sequential calls.
+    """
+    if not calls:
+        return []
+    try:
+        aggregator = _multicall3_contract(w3)
+    except Exception:
+        return None  # transient; probe again on the next call
+    if aggregator is None:
+        return None
+    payload = [
+        (
+            target,
+            True,
+            Web3.to_bytes(hexstr=data) if isinstance(data, str) else data,
+        )
+        for target, data in calls
+    ]
+    try:
+        results = aggregator.functions.aggregate3(payload).call()
+    except Exception:
+        return None
+    return [(bool(success), bytes(data)) for success, data in results]
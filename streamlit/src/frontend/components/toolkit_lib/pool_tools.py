@@ -1,17 +1,95 @@
 from __future__ import annotations
 
+import math
 import os
+import threading
+import time
+from concurrent.futures import Future
 from decimal import Decimal
+from functools import lru_cache, partial
 from typing import Any, Callable, Dict, Optional, Tuple
 
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import ContractLogicError, BadFunctionCallOutput
 
+import streamlit as st
+
 from .messages import tool_success, tool_error
-from .tx_helpers import fee_params, next_nonce, sign_and_send, metamask_tx_request
+from .multicall import multicall3
+from .tx_helpers import (
+    chain_id_for,
+    fee_params,
+    metamask_tx_request,
+    next_nonce,
+    nonce_manager,
+    release_nonce,
+    sign_and_broadcast,
+    sign_and_send,
+    signer_lock,
+    tx_status,
+)
 
 from ..config import PRIVATE_KEY_ENV
+from ..web3_utils import encode_contract_call
+
+
+_DECIMAL_ZERO = Decimal(0)
+_POOL_SNAPSHOT_KEY = "_pool_snap"
+_POOL_SNAPSHOT_TTL = 2.0  # seconds; about one Arc block
+_POOL_SNAPSHOT_INFLIGHT_KEY = "_pool_snap_inflight"
+_POOL_SNAPSHOT_WAIT = 10.0  # seconds to wait on a sibling's refresh
+_FEES_TTL = 4.0  # seconds; maxFeePerGas carries 2x base-fee headroom
+_LOAN_STATUS_TYPES = ("uint8", "uint256", "uint256", "uint256", "uint256", "bool")
+
+_WALLET_NOT_CONFIGURED: Dict[str, str] = {
+    "Owner": (
+        "Owner wallet not configured. Assign an owner address via MetaMask role "
+        "assignment or set PRIVATE_KEY."
+    ),
+    "Lender": (
+        "Lender wallet not configured. Assign a lender address via MetaMask role "
+        "assignment or set LENDER_PRIVATE_KEY."
+    ),
+    "Borrower": (
+        "Borrower wallet not configured. Assign a borrower address via MetaMask "
+        "role assignment or set BORROWER_PRIVATE_KEY."
+    ),
+}
+
+
+@lru_cache(maxsize=1024)
+def _checksum(address: str) -> str:
+    """Memoized ``Web3.to_checksum_address``; raises ValueError on bad input."""
+    return Web3.to_checksum_address(address)
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Decimal for a tool amount; ints skip the str() round-trip.
+
+    Floats still go through str() so the human-typed digits are kept.
+    """
+    if type(value) is int or isinstance(value, Decimal):
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+def _parse_amount(value: Any) -> Optional[Decimal]:
+    """Finite Decimal for a tool amount, or None when it is not a number.
+
+    JSON numbers take the isinstance path; only strings and other odd
+    inputs fall through to the try/except.
+    """
+    if type(value) is int:
+        return Decimal(value)
+    if type(value) is float:
+        return Decimal(str(value)) if math.isfinite(value) else None
+    try:
+        parsed = _to_decimal(value)
+    except Exception:
+        return None
+    return parsed if parsed.is_finite() else None
 
 
 _LOAN_STATE_LABELS: Dict[int, str] = {
@@ -22,6 +100,139 @@ _LOAN_STATE_LABELS: Dict[int, str] = {
 }
 
 
+# Tool parameter schemas; shared by every toolkit build, never mutated.
+_AVAILABLE_LIQUIDITY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+}
+
+_LENDER_BALANCE_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "lender_address": {
+            "type": "string",
+            "description": "Lender wallet address.",
+        }
+    },
+    "required": ["lender_address"],
+}
+
+_LENDER_STATUS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "lender_address": {
+            "type": "string",
+            "description": "Lender wallet address.",
+        }
+    },
+    "required": ["lender_address"],
+}
+
+_GET_LOAN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_address": {
+            "type": "string",
+            "description": "Borrower wallet address.",
+        }
+    },
+    "required": ["borrower_address"],
+}
+
+_IS_BANNED_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_address": {
+            "type": "string",
+            "description": "Borrower wallet address.",
+        },
+        "wallet_address": {
+            "type": "string",
+            "description": "Alias for borrower_address; included for compatibility.",
+        },
+    },
+    "required": [],
+}
+
+_DEPOSIT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "amount": {
+            "type": "number",
+            "description": "Amount in human units (e.g., 100 USDC).",
+        }
+    },
+    "required": ["amount"],
+}
+
+_WITHDRAW_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "amount": {"type": "number", "description": "Amount in human units."}
+    },
+    "required": ["amount"],
+}
+
+_OPEN_LOAN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_address": {
+            "type": "string",
+            "description": "Borrower wallet address.",
+        },
+        "principal": {
+            "type": "number",
+            "description": "Principal in human units (e.g., 50 USDC).",
+        },
+        "term_seconds": {
+            "type": "integer",
+            "description": "Loan term in seconds (e.g., 604800 for 7 days).",
+        },
+    },
+    "required": ["borrower_address", "principal", "term_seconds"],
+}
+
+_REPAY_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {},
+    "required": [],
+}
+
+_CHECK_DEFAULT_AND_BAN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_address": {
+            "type": "string",
+            "description": "Borrower wallet address.",
+        }
+    },
+    "required": ["borrower_address"],
+}
+
+_UNBAN_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "borrower_address": {
+            "type": "string",
+            "description": "Borrower wallet address.",
+        }
+    },
+    "required": ["borrower_address"],
+}
+
+_TX_STATUS_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "tx_hash": {
+            "type": "string",
+            "description": "txHash returned by deposit/withdraw/openLoan/repay/etc.",
+        }
+    },
+    "required": ["tx_hash"],
+}
+
+
 def build_lending_pool_toolkit(
     *,
     w3: Web3,
@@ -42,13 +253,23 @@ def build_lending_pool_toolkit(
     role_private_keys = role_private_keys or {}
     role_addresses = role_addresses or {}
 
-    def _acct_for_key(key: Optional[str]) -> Optional[str]:
+    account_cache: Dict[str, Optional[LocalAccount]] = {}
+
+    def _account_for_key(key: Optional[str]) -> Optional[LocalAccount]:
         if not key:
             return None
-        try:
-            return w3.eth.account.from_key(key).address  # type: ignore[arg-type]
-        except Exception:
-            return None
+        # Loading the key is an EC multiplication; keys rarely change. The
+        # cached account also signs without decoding the key again.
+        if key not in account_cache:
+            try:
+                account_cache[key] = w3.eth.account.from_key(key)  # type: ignore[arg-type]
+            except Exception:
+                account_cache[key] = None
+        return account_cache[key]
+
+    def _acct_for_key(key: Optional[str]) -> Optional[str]:
+        account = _account_for_key(key)
+        return account.address if account is not None else None
 
     def _get_owner_key() -> Optional[str]:
         return role_private_keys.get("Owner") or derived_private_key
@@ -98,7 +319,7 @@ def build_lending_pool_toolkit(
             "metamask": {
                 "tx_request": tx_req,
                 "action": "eth_sendTransaction",
-                "chainId": w3.eth.chain_id,
+                "chainId": chain_id_for(w3),
                 "hint": hint,
             }
         }
@@ -106,22 +327,96 @@ def build_lending_pool_toolkit(
             payload["metamask"]["from"] = from_addr
         return tool_success(payload)
 
-    def _fees() -> Dict[str, int]:
-        return fee_params(w3, gas_price_gwei)
+    fees_cache: Dict[str, Any] = {"at": 0.0, "fees": None}
 
-    def _to_token_units(amount: float | int, *, use_native: bool = False) -> int:
-        try:
-            amt = Decimal(str(amount))
-            scale = Decimal(10) ** int(
-                native_decimals if use_native else token_decimals
+    def _fees_fresh(ttl: float = _FEES_TTL) -> bool:
+        return (
+            fees_cache["fees"] is not None
+            and time.monotonic() - fees_cache["at"] <= ttl
+        )
+
+    def _fees(ttl: float = _FEES_TTL, latest: Optional[Any] = None) -> Dict[str, int]:
+        """Fee params shared by writes within ``ttl`` seconds; do not mutate."""
+        if not _fees_fresh(ttl):
+            fees_cache.update(
+                at=time.monotonic(), fees=fee_params(w3, gas_price_gwei, latest)
             )
+        return fees_cache["fees"]
+
+    def _cold_write_state(signer: str) -> Tuple[Optional[Any], Optional[int]]:
+        """Latest block and pending nonce in one batch when both would be fetched.
+
+        Returns ``(None, None)`` when either is cached or batching fails.
+        """
+        if _fees_fresh() or nonce_manager().is_seeded(w3, signer):
+            return None, None
+        try:
+            with w3.batch_requests() as batch:
+                batch.add(w3.eth.get_block("latest"))
+                batch.add(w3.eth.get_transaction_count(signer, "pending"))
+                latest, pending = batch.execute()
+        except Exception:
+            return None, None
+        return latest, int(pending)
+
+    def _tx_defaults(
+        signer: str, gas: Optional[int] = None, latest: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """Fresh tx params for ``signer`` minus the nonce and value."""
+        return {
+            "from": signer,
+            "gas": gas or default_gas_limit,
+            "chainId": chain_id_for(w3),
+            **_fees(latest=latest),
+        }
+
+    def _sign_and_send(
+        account: LocalAccount, tx: Dict[str, Any], wait: bool = False
+    ) -> Dict[str, Any]:
+        # Unless ``wait``, returns once the node accepts the tx and txStatus
+        # reports the receipt.
+        if wait:
+            sent = sign_and_send(w3, account, tx)
+        else:
+            sent = sign_and_broadcast(w3, account, tx)
+        # Pool state may have changed; later views must not reuse the snapshot.
+        st.session_state.pop(_POOL_SNAPSHOT_KEY, None)
+        return sent
+
+    token_scale = 10 ** int(token_decimals)
+    native_scale = 10 ** int(native_decimals)
+    token_scale_decimal = Decimal(token_scale)
+    native_scale_decimal = Decimal(native_scale)
+
+    def _to_token_units(
+        amount: Decimal | float | int, *, use_native: bool = False
+    ) -> int:
+        if isinstance(amount, int):
+            return amount * (native_scale if use_native else token_scale)
+        try:
+            amt = _to_decimal(amount)
+            if amt == amt.to_integral_value():
+                return int(amt) * (native_scale if use_native else token_scale)
+            scale = native_scale_decimal if use_native else token_scale_decimal
             return int(amt * scale)
         except Exception:
             return int(amount)
 
     def _from_token_units(amount: int, *, use_native: bool = False) -> Decimal:
-        scale = Decimal(10) ** int(native_decimals if use_native else token_decimals)
-        return (Decimal(amount) / scale) if amount else Decimal(0)
+        scale = native_scale_decimal if use_native else token_scale_decimal
+        return (Decimal(amount) / scale) if amount else _DECIMAL_ZERO
+
+    def _positive_native_units(value: Any, label: str) -> Tuple[int, Optional[str]]:
+        """Parse a positive human amount into native units: ``(units, error)``."""
+        parsed = _parse_amount(value)
+        if parsed is None:
+            return 0, f"Invalid {label.lower()} supplied; enter a numeric value."
+        if parsed <= _DECIMAL_ZERO:
+            return 0, f"{label} must be greater than zero."
+        try:
+            return _to_token_units(parsed, use_native=True), None
+        except Exception as exc:
+            return 0, f"Invalid {label.lower()}: {exc}"
 
     def _normalize_reason(reason: str) -> str:
         return str(reason or "").replace("_", " ").lower()
@@ -217,12 +512,140 @@ def build_lending_pool_toolkit(
         except Exception as exc:
             return False, f"Unable to evaluate loan conditions: {exc}"
 
+    pool_functions = frozenset(
+        entry.get("name")
+        for entry in pool_contract.abi or ()
+        if entry.get("type") == "function"
+    )
+    snapshot_lock = threading.Lock()
+
+    def _fetch_pool_snapshot(
+        borrowers: Tuple[str, ...], lenders: Tuple[str, ...]
+    ) -> Optional[Dict[str, Any]]:
+        calls: list[Tuple[str, str]] = []
+        if "availableLiquidity" in pool_functions:
+            calls.append(("availableLiquidity", ""))
+        if "lenderBalance" in pool_functions:
+            calls.extend(("lenderBalance", lender) for lender in lenders)
+        if "loanStatus" in pool_functions:
+            calls.extend(("loanStatus", borrower) for borrower in borrowers)
+        if not calls:
+            return None
+        results = multicall3(
+            w3,
+            [
+                (
+                    pool_contract.address,
+                    encode_contract_call(
+                        pool_contract, fn_name, [address] if address else []
+                    ),
+                )
+                for fn_name, address in calls
+            ],
+        )
+        if results is None:
+            return None
+        snapshot: Dict[str, Any] = {"lenderBalance": {}, "loanStatus": {}}
+        for (fn_name, address), (ok, data) in zip(calls, results):
+            if not ok:
+                continue
+            if fn_name == "loanStatus":
+                state, principal, outstanding, start, due, banned_flag = (
+                    w3.codec.decode(_LOAN_STATUS_TYPES, data)
+                )
+                snapshot["loanStatus"][address] = (
+                    int(state),
+                    int(principal),
+                    int(outstanding),
+                    int(start),
+                    int(due),
+                    bool(banned_flag),
+                )
+            else:
+                (value,) = w3.codec.decode(["uint256"], data)
+                if fn_name == "lenderBalance":
+                    snapshot["lenderBalance"][address] = int(value)
+                else:
+                    snapshot[fn_name] = int(value)
+        return snapshot
+
+    def _snapshot_value(section: str, address: Optional[str] = None) -> Any:
+        """Read a view result from the short-lived Multicall3 pool snapshot.
+
+        A miss refreshes the snapshot for ``address`` plus the session's role
+        addresses, so sibling view tools in the same chat turn hit the cache.
+        Refreshes are single-flight: a tool that finds one in progress waits
+        for it instead of sending its own multicall. Returns None when the
+        value is unavailable; callers then read directly.
+        """
+        if section not in pool_functions:
+            return None  # the ABI has no such view; go straight to the fallback
+
+        def lookup(snapshot: Dict[str, Any]) -> Any:
+            value = snapshot.get(section)
+            return value.get(address) if address is not None else value
+
+        try:
+            # The lock only guards the session entries; the RPC runs outside
+            # it so a slow endpoint cannot stall other tool threads or sessions.
+            with snapshot_lock:
+                cached = st.session_state.get(_POOL_SNAPSHOT_KEY)
+                inflight = st.session_state.get(_POOL_SNAPSHOT_INFLIGHT_KEY)
+                owner = inflight is None
+                if owner:
+                    inflight = Future()
+                    st.session_state[_POOL_SNAPSHOT_INFLIGHT_KEY] = inflight
+            now = time.monotonic()
+            if (
+                cached is not None
+                and cached[0] == pool_contract.address
+                and now - cached[1] < _POOL_SNAPSHOT_TTL
+            ):
+                value = lookup(cached[2])
+                if value is not None:
+                    if owner:
+                        with snapshot_lock:
+                            st.session_state.pop(_POOL_SNAPSHOT_INFLIGHT_KEY, None)
+                        inflight.set_result(None)
+                    return value
+            if not owner:
+                snapshot = inflight.result(timeout=_POOL_SNAPSHOT_WAIT)
+                # None when the shared refresh did not cover this address; the
+                # caller's direct read is then a single call, no worse.
+                return lookup(snapshot) if snapshot is not None else None
+            try:
+                borrowers = {_get_borrower_address()}
+                lenders = {_get_lender_address()}
+                if section == "loanStatus":
+                    borrowers.add(address)
+                elif section == "lenderBalance":
+                    lenders.add(address)
+                snapshot = _fetch_pool_snapshot(
+                    tuple(a for a in borrowers if a), tuple(a for a in lenders if a)
+                )
+            except Exception:
+                snapshot = None
+            with snapshot_lock:
+                if snapshot is not None:
+                    st.session_state[_POOL_SNAPSHOT_KEY] = (
+                        pool_contract.address,
+                        now,
+                        snapshot,
+                    )
+                st.session_state.pop(_POOL_SNAPSHOT_INFLIGHT_KEY, None)
+            inflight.set_result(snapshot)
+            return lookup(snapshot) if snapshot is not None else None
+        except Exception:
+            return None
+
     # ---- Views ----
     def availableLiquidity_tool() -> str:
         try:
-            amount = int(
-                getattr(pool_contract.functions, "availableLiquidity")().call()
-            )
+            amount = _snapshot_value("availableLiquidity")
+            if amount is None:
+                amount = int(
+                    getattr(pool_contract.functions, "availableLiquidity")().call()
+                )
             return tool_success({"availableLiquidity": amount})
         except Exception as exc:
             return tool_error(f"Read failed: {exc}")
@@ -230,16 +653,18 @@ def build_lending_pool_toolkit(
     register(
         "availableLiquidity",
         "Read pool's available liquidity (token balance).",
-        {"type": "object", "properties": {}, "required": []},
+        _AVAILABLE_LIQUIDITY_SCHEMA,
         lambda: availableLiquidity_tool(),
     )
 
     def lenderBalance_tool(lender_address: str) -> str:
         try:
-            lender = Web3.to_checksum_address(lender_address)
-            amount = int(
-                getattr(pool_contract.functions, "lenderBalance")(lender).call()
-            )
+            lender = _checksum(lender_address)
+            amount = _snapshot_value("lenderBalance", lender)
+            if amount is None:
+                amount = int(
+                    getattr(pool_contract.functions, "lenderBalance")(lender).call()
+                )
             return tool_success({"lender": lender, "balance": amount})
         except Exception as exc:
             return tool_error(f"Read failed: {exc}")
@@ -247,22 +672,13 @@ def build_lending_pool_toolkit(
     register(
         "lenderBalance",
         "Read net balance (deposits - withdrawals) for a lender.",
-        {
-            "type": "object",
-            "properties": {
-                "lender_address": {
-                    "type": "string",
-                    "description": "Lender wallet address.",
-                }
-            },
-            "required": ["lender_address"],
-        },
+        _LENDER_BALANCE_SCHEMA,
         lenderBalance_tool,
     )
 
     def lenderStatus_tool(lender_address: str) -> str:
         try:
-            lender = Web3.to_checksum_address(lender_address)
+            lender = _checksum(lender_address)
         except ValueError:
             return tool_error("Invalid lender address supplied.")
         status = _lender_status(lender)
@@ -286,23 +702,14 @@ def build_lending_pool_toolkit(
     register(
         "lenderStatus",
         "Read aggregated lender metrics (deposited, withdrawn, unlockable).",
-        {
-            "type": "object",
-            "properties": {
-                "lender_address": {
-                    "type": "string",
-                    "description": "Lender wallet address.",
-                }
-            },
-            "required": ["lender_address"],
-        },
+        _LENDER_STATUS_SCHEMA,
         lenderStatus_tool,
     )
 
     def getLoan_tool(borrower_address: str) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
-            status = _loan_status(borrower)
+            borrower = _checksum(borrower_address)
+            status = _snapshot_value("loanStatus", borrower) or _loan_status(borrower)
             if status is None:
                 return tool_error("Unable to read loan status for borrower.")
             state_code, principal, outstanding, start_time, due_time, banned_flag = (
@@ -331,16 +738,7 @@ def build_lending_pool_toolkit(
     register(
         "getLoan",
         "Read loan struct for a borrower (principal, outstanding, startTime, dueTime, state).",
-        {
-            "type": "object",
-            "properties": {
-                "borrower_address": {
-                    "type": "string",
-                    "description": "Borrower wallet address.",
-                }
-            },
-            "required": ["borrower_address"],
-        },
+        _GET_LOAN_SCHEMA,
         getLoan_tool,
     )
 
@@ -353,8 +751,13 @@ def build_lending_pool_toolkit(
                 "Borrower address is required. Provide `borrower_address` or `wallet_address`."
             )
         try:
-            borrower = Web3.to_checksum_address(address_input)
-            banned = bool(getattr(pool_contract.functions, "isBanned")(borrower).call())
+            borrower = _checksum(address_input)
+            status = _snapshot_value("loanStatus", borrower)
+            banned = (
+                status[5]
+                if status is not None
+                else bool(getattr(pool_contract.functions, "isBanned")(borrower).call())
+            )
             return tool_success({"borrower": borrower, "banned": banned})
         except ValueError:
             return tool_error("Borrower address is not valid.")
@@ -364,122 +767,129 @@ def build_lending_pool_toolkit(
     register(
         "isBanned",
         "Check if a borrower is banned due to default.",
-        {
-            "type": "object",
-            "properties": {
-                "borrower_address": {
-                    "type": "string",
-                    "description": "Borrower wallet address.",
-                },
-                "wallet_address": {
-                    "type": "string",
-                    "description": "Alias for borrower_address; included for compatibility.",
-                },
-            },
-            "required": [],
-        },
+        _IS_BANNED_SCHEMA,
         isBanned_tool,
     )
 
     # ---- Writes ----
-    def deposit_tool(amount: float | int) -> str:
-        try:
-            amt_decimal = Decimal(str(amount))
-        except Exception:
-            return tool_error("Invalid amount supplied; enter a numeric value.")
-        if amt_decimal <= Decimal("0"):
-            return tool_error("Amount must be greater than zero.")
-        try:
-            amt = _to_token_units(amt_decimal, use_native=True)
-        except Exception as exc:
-            return tool_error(f"Invalid amount: {exc}")
-
-        signer = _acct_for_key(lender_key)
-        if signer and lender_key:
+    # Bound once; web3 resolves the ABI entry on every attribute access.
+    deposit_fn = getattr(pool_contract.functions, "deposit", None)
+    withdraw_fn = getattr(pool_contract.functions, "withdraw", None)
+    openLoan_fn = getattr(pool_contract.functions, "openLoan", None)
+    repay_fn = getattr(pool_contract.functions, "repay", None)
+    checkDefaultAndBan_fn = getattr(pool_contract.functions, "checkDefaultAndBan", None)
+    unban_fn = getattr(pool_contract.functions, "unban", None)
+    metamask_requests: Dict[str, Callable[..., Dict[str, Any]]] = {
+        name: partial(metamask_tx_request, pool_contract, name)
+        for name in (
+            "deposit",
+            "withdraw",
+            "openLoan",
+            "repay",
+            "checkDefaultAndBan",
+            "unban",
+        )
+    }
+
+    def _submit_role_tx(
+        role: str,
+        fn_name: str,
+        contract_fn: Any,
+        args: list[Any],
+        *,
+        private_key: Optional[str],
+        from_address: Optional[str],
+        hint: str,
+        value: int = 0,
+        gas: Optional[int] = None,
+        on_error: Optional[Callable[[Dict[str, Any]], str]] = None,
+        include_hint: bool = False,
+        wait_for_receipt: bool = False,
+    ) -> str:
+        """Sign with the role key, else return a MetaMask request, else an error."""
+        account = _account_for_key(private_key)
+        if account is not None:
+            signer = account.address
             try:
-                tx = pool_contract.functions.deposit(amt).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        "value": amt,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, lender_key, tx)  # type: ignore[arg-type]
-                return (
-                    tool_success(sent)
-                    if "error" not in sent
-                    else tool_error(sent.get("error", "deposit failed"))
-                )
+                latest, pending = _cold_write_state(signer)
+                params = _tx_defaults(signer, gas, latest)
+                if value:
+                    params["value"] = value
+                with signer_lock(w3, signer):
+                    # Reserve the nonce last so a failed fee lookup cannot
+                    # leak it.
+                    params["nonce"] = next_nonce(w3, signer, pending)
+                    try:
+                        tx = contract_fn(*args).build_transaction(params)
+                    except Exception:
+                        release_nonce(w3, params)
+                        raise
+                    sent = _sign_and_send(account, tx, wait=wait_for_receipt)
+                if "error" in sent:
+                    if on_error is not None:
+                        return on_error(sent)
+                    return tool_error(sent.get("error", f"{fn_name} failed"))
+                if include_hint:
+                    sent.setdefault("hint", hint)
+                return tool_success(sent)
             except ContractLogicError as exc:
                 return tool_error(f"Contract rejected: {exc}")
             except Exception as exc:
-                return tool_error(f"deposit failed: {exc}")
+                return tool_error(f"{fn_name} failed: {exc}")
 
-        lender_addr = _get_lender_address()
-        if lender_addr:
+        if from_address:
             try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "deposit",
-                    [amt],
-                    value_wei=amt,
-                    from_address=lender_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (lender wallet) to deposit native USDC into the pool.",
-                    lender_addr,
+                tx_req = metamask_requests[fn_name](
+                    args, value_wei=value, from_address=from_address
                 )
+                if gas:
+                    tx_req["gas"] = hex(gas)
+                return _metamask_success(tx_req, hint, from_address)
             except Exception as exc:
                 return tool_error(f"Unable to build MetaMask tx: {exc}")
 
-        return tool_error(
-            "Lender wallet not configured. Assign a lender address via MetaMask role assignment or set LENDER_PRIVATE_KEY."
+        return tool_error(_WALLET_NOT_CONFIGURED[role])
+
+    def deposit_tool(amount: float | int) -> str:
+        amt, amount_error = _positive_native_units(amount, "Amount")
+        if amount_error:
+            return tool_error(amount_error)
+
+        return _submit_role_tx(
+            "Lender",
+            "deposit",
+            deposit_fn,
+            [amt],
+            private_key=lender_key,
+            from_address=_get_lender_address(),
+            hint="Use MetaMask (lender wallet) to deposit native USDC into the pool.",
+            value=amt,
         )
 
     register(
         "deposit",
         "Deposit USDC into the LendingPool (requires prior approve).",
-        {
-            "type": "object",
-            "properties": {
-                "amount": {
-                    "type": "number",
-                    "description": "Amount in human units (e.g., 100 USDC).",
-                }
-            },
-            "required": ["amount"],
-        },
+        _DEPOSIT_SCHEMA,
         deposit_tool,
     )
 
     def withdraw_tool(amount: float | int) -> str:
-        try:
-            amt_decimal = Decimal(str(amount))
-        except Exception:
-            return tool_error("Invalid amount supplied; enter a numeric value.")
-        if amt_decimal <= Decimal("0"):
-            return tool_error("Amount must be greater than zero.")
-        try:
-            amt = _to_token_units(amt_decimal, use_native=True)
-        except Exception as exc:
-            return tool_error(f"Invalid amount: {exc}")
+        amt, amount_error = _positive_native_units(amount, "Amount")
+        if amount_error:
+            return tool_error(amount_error)
 
         lender_addr = _get_lender_address()
         status_address: Optional[str] = None
         if lender_addr:
             try:
-                status_address = Web3.to_checksum_address(lender_addr)
+                status_address = _checksum(lender_addr)
             except ValueError:
                 status_address = None
         if status_address is None:
             signer = _acct_for_key(lender_key)
             if signer:
                 try:
-                    status_address = Web3.to_checksum_address(signer)
+                    status_address = _checksum(signer)
                 except ValueError:
                     status_address = None
 
@@ -493,59 +903,20 @@ def build_lending_pool_toolkit(
                         f"Requested withdrawal exceeds unlocked balance ({human_unlockable} available)."
                     )
 
-        signer = _acct_for_key(lender_key)
-        if signer and lender_key:
-            try:
-                tx = pool_contract.functions.withdraw(amt).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, lender_key, tx)  # type: ignore[arg-type]
-                return (
-                    tool_success(sent)
-                    if "error" not in sent
-                    else tool_error(sent.get("error", "withdraw failed"))
-                )
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"withdraw failed: {exc}")
-
-        if lender_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "withdraw",
-                    [amt],
-                    from_address=lender_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (lender wallet) to withdraw unlocked funds.",
-                    lender_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Lender wallet not configured. Assign a lender address via MetaMask role assignment or set LENDER_PRIVATE_KEY."
+        return _submit_role_tx(
+            "Lender",
+            "withdraw",
+            withdraw_fn,
+            [amt],
+            private_key=lender_key,
+            from_address=lender_addr,
+            hint="Use MetaMask (lender wallet) to withdraw unlocked funds.",
         )
 
     register(
         "withdraw",
         "Withdraw available USDC from the LendingPool (subject to liquidity/locks).",
-        {
-            "type": "object",
-            "properties": {
-                "amount": {"type": "number", "description": "Amount in human units."}
-            },
-            "required": ["amount"],
-        },
+        _WITHDRAW_SCHEMA,
         withdraw_tool,
     )
 
@@ -553,23 +924,25 @@ def build_lending_pool_toolkit(
         borrower_address: str, principal: float | int, term_seconds: int
     ) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = _checksum(borrower_address)
         except ValueError:
             return tool_error("Invalid borrower address supplied.")
         if borrower_guard:
             guard_error = borrower_guard(borrower)
             if guard_error:
                 return tool_error(guard_error)
-        try:
-            principal_decimal = Decimal(str(principal))
-        except Exception:
-            return tool_error("Invalid principal supplied; enter a numeric value.")
-        if principal_decimal <= Decimal("0"):
-            return tool_error("Principal must be greater than zero.")
-        try:
-            principal_units = _to_token_units(principal_decimal, use_native=True)
-        except Exception as exc:
-            return tool_error(f"Invalid principal: {exc}")
+        principal_units, principal_error = _positive_native_units(
+            principal, "Principal"
+        )
+        if principal_error:
+            return tool_error(principal_error)
+        # Schema says integer, but models sometimes send "604800" or 604800.0.
+        term = term_seconds if type(term_seconds) is int else None
+        if term is None:
+            try:
+                term = int(term_seconds)
+            except (TypeError, ValueError):
+                return tool_error("Invalid term_seconds; enter a whole number.")
 
         ok, reason = _can_open_loan(borrower, principal_units)
         if not ok:
@@ -622,86 +995,36 @@ def build_lending_pool_toolkit(
             )
             return tool_error(f"Cannot open loan: {human_readable_reason}")
 
-        owner_pk = _get_owner_key()
-        signer = _acct_for_key(owner_pk)
-        if signer and owner_pk:
-            try:
-                fees = _fees()
-                nonce = next_nonce(w3, signer)
-                tx = pool_contract.functions.openLoan(
-                    borrower, principal_units, int(term_seconds)
-                ).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": nonce,
-                        "gas": max(
-                            default_gas_limit, 500000
-                        ),  # openLoan needs ~500k gas
-                        "chainId": w3.eth.chain_id,
-                        **fees,
-                    }
-                )
-                sent = sign_and_send(w3, owner_pk, tx)  # type: ignore[arg-type]
-                if "error" in sent:
-                    reason = sent.get("reason")
-                    if reason:
-                        return tool_error(f"{sent['error']}: {reason}")
-                    detail = sent.get("error")
-                    if detail and detail.strip():
-                        return tool_error(detail)
-                    return tool_error(
-                        "Transaction reverted without a reason. Check that the owner wallet matches `Ownable.initialOwner` and that the borrower has no active loan, is not banned, and the pool has sufficient liquidity."
-                    )
-                return tool_success(sent)
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"openLoan failed: {exc}")
-
-        owner_addr = _get_owner_address()
-        if owner_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "openLoan",
-                    [borrower, principal_units, int(term_seconds)],
-                    from_address=owner_addr,
-                )
-                # openLoan needs more gas due to SBT checks + native transfer
-                tx_req["gas"] = hex(500000)  # 500k gas limit
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (owner wallet) to open a loan.",
-                    owner_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
+        def _open_loan_error(sent: Dict[str, Any]) -> str:
+            reason = sent.get("reason")
+            if reason:
+                return tool_error(f"{sent['error']}: {reason}")
+            detail = sent.get("error")
+            if detail and detail.strip():
+                return tool_error(detail)
+            return tool_error(
+                "Transaction reverted without a reason. Check that the owner wallet matches `Ownable.initialOwner` and that the borrower has no active loan, is not banned, and the pool has sufficient liquidity."
+            )
 
-        return tool_error(
-            "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY."
+        # openLoan needs ~500k gas due to SBT checks + native transfer
+        return _submit_role_tx(
+            "Owner",
+            "openLoan",
+            openLoan_fn,
+            [borrower, principal_units, term],
+            private_key=_get_owner_key(),
+            from_address=_get_owner_address(),
+            hint="Use MetaMask (owner wallet) to open a loan.",
+            gas=max(default_gas_limit, 500000),
+            on_error=_open_loan_error,
+            # Blocking, so on-chain reverts reach _open_loan_error's guidance.
+            wait_for_receipt=True,
         )
 
     register(
         "openLoan",
         "Owner-only: open a loan for borrower and transfer principal.",
-        {
-            "type": "object",
-            "properties": {
-                "borrower_address": {
-                    "type": "string",
-                    "description": "Borrower wallet address.",
-                },
-                "principal": {
-                    "type": "number",
-                    "description": "Principal in human units (e.g., 50 USDC).",
-                },
-                "term_seconds": {
-                    "type": "integer",
-                    "description": "Loan term in seconds (e.g., 604800 for 7 days).",
-                },
-            },
-            "required": ["borrower_address", "principal", "term_seconds"],
-        },
+        _OPEN_LOAN_SCHEMA,
         openLoan_tool,
     )
 
@@ -711,12 +1034,10 @@ def build_lending_pool_toolkit(
         borrower_pk = _get_borrower_key()
 
         if not borrower_addr:
-            return tool_error(
-                "Borrower wallet not configured. Assign a borrower address via MetaMask role assignment or set BORROWER_PRIVATE_KEY."
-            )
+            return tool_error(_WALLET_NOT_CONFIGURED["Borrower"])
 
         try:
-            borrower = Web3.to_checksum_address(borrower_addr)
+            borrower = _checksum(borrower_addr)
         except ValueError:
             return tool_error("Borrower address is not valid.")
 
@@ -735,195 +1056,89 @@ def build_lending_pool_toolkit(
         amt_decimal = _from_token_units(amt, use_native=True)
         hint = f"Repay outstanding balance ({amt_decimal} in native units)."
 
-        signer = _acct_for_key(borrower_pk)
-        if signer and borrower_pk:
-            try:
-                tx = pool_contract.functions.repay(amt).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        "value": amt,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, borrower_pk, tx)  # type: ignore[arg-type]
-                if "error" in sent:
-                    return tool_error(sent.get("error", "repay failed"))
-                sent.setdefault("hint", hint)
-                return tool_success(sent)
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"repay failed: {exc}")
-
-        if borrower_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "repay",
-                    [amt],
-                    value_wei=amt,
-                    from_address=borrower_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    hint,
-                    borrower_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Borrower wallet not configured. Assign a borrower address via MetaMask role assignment or set BORROWER_PRIVATE_KEY."
+        return _submit_role_tx(
+            "Borrower",
+            "repay",
+            repay_fn,
+            [amt],
+            private_key=borrower_pk,
+            from_address=borrower_addr,
+            hint=hint,
+            value=amt,
+            include_hint=True,
         )
 
     register(
         "repay",
         "Borrower: repay outstanding loan balance (full payoff only).",
-        {
-            "type": "object",
-            "properties": {},
-            "required": [],
-        },
+        _REPAY_SCHEMA,
         repay_tool,
     )
 
     def checkDefaultAndBan_tool(borrower_address: str) -> str:
-        signer = _acct_for_key(owner_key)
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = _checksum(borrower_address)
         except ValueError:
             return tool_error("Invalid borrower address supplied.")
-        if signer and owner_key:
-            try:
-                fees = _fees()
-                nonce = next_nonce(w3, signer)
-                tx = pool_contract.functions.checkDefaultAndBan(
-                    borrower
-                ).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": nonce,
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        **fees,
-                    }
-                )
-                sent = sign_and_send(w3, owner_pk, tx)  # type: ignore[arg-type]
-                return (
-                    tool_success(sent)
-                    if "error" not in sent
-                    else tool_error(sent.get("error", "checkDefaultAndBan failed"))
-                )
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"checkDefaultAndBan failed: {exc}")
-
-        owner_addr = _get_owner_address()
-        if owner_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "checkDefaultAndBan",
-                    [borrower],
-                    from_address=owner_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (owner wallet) to check default and ban overdue borrower.",
-                    owner_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY."
+        return _submit_role_tx(
+            "Owner",
+            "checkDefaultAndBan",
+            checkDefaultAndBan_fn,
+            [borrower],
+            private_key=owner_key,
+            from_address=_get_owner_address(),
+            hint="Use MetaMask (owner wallet) to check default and ban overdue borrower.",
         )
 
     register(
         "checkDefaultAndBan",
         "Anyone: check if borrower defaulted and ban if overdue.",
-        {
-            "type": "object",
-            "properties": {
-                "borrower_address": {
-                    "type": "string",
-                    "description": "Borrower wallet address.",
-                }
-            },
-            "required": ["borrower_address"],
-        },
+        _CHECK_DEFAULT_AND_BAN_SCHEMA,
         checkDefaultAndBan_tool,
     )
 
     def unban_tool(borrower_address: str) -> str:
         try:
-            borrower = Web3.to_checksum_address(borrower_address)
+            borrower = _checksum(borrower_address)
         except ValueError:
             return tool_error("Invalid borrower address supplied.")
 
-        owner_pk = _get_owner_key()
-        signer = _acct_for_key(owner_pk)
-        if signer and owner_pk:
-            try:
-                tx = pool_contract.functions.unban(borrower).build_transaction(
-                    {
-                        "from": signer,
-                        "nonce": next_nonce(w3, signer),
-                        "gas": default_gas_limit,
-                        "chainId": w3.eth.chain_id,
-                        **_fees(),
-                    }
-                )
-                sent = sign_and_send(w3, owner_pk, tx)  # type: ignore[arg-type]
-                return (
-                    tool_success(sent)
-                    if "error" not in sent
-                    else tool_error(sent.get("error", "unban failed"))
-                )
-            except ContractLogicError as exc:
-                return tool_error(f"Contract rejected: {exc}")
-            except Exception as exc:
-                return tool_error(f"unban failed: {exc}")
-
-        owner_addr = _get_owner_address()
-        if owner_addr:
-            try:
-                tx_req = metamask_tx_request(
-                    pool_contract,
-                    "unban",
-                    [borrower],
-                    from_address=owner_addr,
-                )
-                return _metamask_success(
-                    tx_req,
-                    "Use MetaMask (owner wallet) to unban borrower after remedy.",
-                    owner_addr,
-                )
-            except Exception as exc:
-                return tool_error(f"Unable to build MetaMask tx: {exc}")
-
-        return tool_error(
-            "Owner wallet not configured. Assign an owner address via MetaMask role assignment or set PRIVATE_KEY."
+        return _submit_role_tx(
+            "Owner",
+            "unban",
+            unban_fn,
+            [borrower],
+            private_key=_get_owner_key(),
+            from_address=_get_owner_address(),
+            hint="Use MetaMask (owner wallet) to unban borrower after remedy.",
         )
 
     register(
         "unban",
         "Owner-only: unban a borrower after remedy.",
-        {
-            "type": "object",
-            "properties": {
-                "borrower_address": {
-                    "type": "string",
-                    "description": "Borrower wallet address.",
-                }
-            },
-            "required": ["borrower_address"],
-        },
+        _UNBAN_SCHEMA,
         unban_tool,
     )
 
+    def txStatus_tool(tx_hash: str) -> str:
+        if not isinstance(tx_hash, str) or not tx_hash.strip():
+            return tool_error("Provide the txHash returned by a pool write.")
+        status = tx_status(w3, tx_hash.strip())
+        if "error" in status:
+            reason = status.get("reason")
+            if reason:
+                return tool_error(f"{status['error']}: {reason}")
+            return tool_error(status["error"])
+        if status.get("receipt"):
+            # Mined; views must not serve the pre-tx snapshot.
+            st.session_state.pop(_POOL_SNAPSHOT_KEY, None)
+        return tool_success(status)
+
+    register(
+        "txStatus",
+        "Check a submitted LendingPool transaction; returns the receipt once mined.",
+        _TX_STATUS_SCHEMA,
+        txStatus_tool,
+    )
+
     return tools, handlers
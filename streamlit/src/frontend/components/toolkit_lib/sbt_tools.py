@@ -1,50 +1,235 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import Any, Callable, Dict, Optional, Tuple
 
+from eth_abi.exceptions import DecodingError
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import ContractLogicError, Web3Exception
+from web3.exceptions import (
+    BadFunctionCallOutput,
+    ContractLogicError,
+    Web3Exception,
+)
 
 from .messages import tool_success, tool_error
-from .tx_helpers import fee_params, next_nonce, sign_and_send
+from .multicall import multicall3
+from .tx_helpers import (
+    chain_id_for,
+    fee_params,
+    next_nonce,
+    release_nonce,
+    sign_and_send,
+    signer_lock,
+)
 
 from ..config import PRIVATE_KEY_ENV
+from ..web3_utils import encode_contract_call
 
 
 _ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 
+_OWNER_OF_ABI = [
+    {
+        "name": "ownerOf",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "tokenId", "type": "uint256"}],
+        "outputs": [{"name": "", "type": "address"}],
+    }
+]
+
+
+_SCORE_READ_ABI = [
+    {
+        "name": "getScore",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "borrower", "type": "address"}],
+        "outputs": [
+            {"name": "value", "type": "uint256"},
+            {"name": "timestamp", "type": "uint256"},
+            {"name": "valid", "type": "bool"},
+        ],
+    },
+    {
+        "name": "scores",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "", "type": "address"}],
+        "outputs": [
+            {"name": "value", "type": "uint256"},
+            {"name": "timestamp", "type": "uint256"},
+            {"name": "valid", "type": "bool"},
+        ],
+    },
+]
+
+_ISSUE_SCORE_ABI = [
+    {
+        "name": "issueScore",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "borrower", "type": "address"},
+            {"name": "value", "type": "uint256"},
+        ],
+        "outputs": [],
+    }
+]
+
+_REVOKE_SCORE_ABI = [
+    {
+        "name": "revokeScore",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [{"name": "borrower", "type": "address"}],
+        "outputs": [],
+    }
+]
+
+_FALLBACK_ABIS: Dict[str, list[Dict[str, Any]]] = {
+    "ownerOf": _OWNER_OF_ABI,
+    "score": _SCORE_READ_ABI,
+    "issueScore": _ISSUE_SCORE_ABI,
+    "revokeScore": _REVOKE_SCORE_ABI,
+}
+
+
+_SEL_HAS_SBT = bytes(Web3.keccak(text="hasSbt(address)")[:4])
+_SEL_OWNER_OF = bytes(Web3.keccak(text="ownerOf(uint256)")[:4])
+_SEL_GET_SCORE = bytes(Web3.keccak(text="getScore(address)")[:4])
+_SEL_OWNER = bytes(Web3.keccak(text="owner()")[:4])
+
+
+def _view_call(
+    w3: Web3,
+    address: str,
+    selector: bytes,
+    arg_types: Tuple[str, ...],
+    args: Tuple[Any, ...],
+    out_types: Tuple[str, ...],
+) -> Tuple[Any, ...]:
+    """eth_call with precomputed selector, skipping web3's per-call ABI lookup."""
+    data = selector + w3.codec.encode(arg_types, args) if arg_types else selector
+    raw = w3.eth.call({"to": address, "data": data})
+    try:
+        return tuple(w3.codec.decode(out_types, raw))
+    except DecodingError as exc:
+        # Match contract.functions.X().call(), which callers' fallbacks expect.
+        raise BadFunctionCallOutput(
+            f"Could not decode {selector.hex()} output from {address}: {exc}"
+        ) from exc
+
+
+def _owner_of(w3: Web3, address: str, token_id: int) -> str:
+    (owner,) = _view_call(
+        w3, address, _SEL_OWNER_OF, ("uint256",), (token_id,), ("address",)
+    )
+    return Web3.to_checksum_address(owner)
+
+
+@lru_cache(maxsize=32)
+def _contract_functions(contract: Contract) -> frozenset[str]:
+    """Function names exposed by ``contract``'s ABI; the shape never changes."""
+    return frozenset(
+        entry.get("name")
+        for entry in contract.abi or ()
+        if entry.get("type") == "function"
+    )
+
+
+def _contract_fn(contract: Contract, name: str) -> Optional[Any]:
+    if name not in _contract_functions(contract):
+        return None
+    return getattr(contract.functions, name, None)
+
+
+@lru_cache(maxsize=32)
+def _fallback_contract(w3: Web3, address: str, abi_key: str) -> Contract:
+    """Minimal-ABI contract used when the loaded ABI lacks a function."""
+    return w3.eth.contract(address=address, abi=_FALLBACK_ABIS[abi_key])
+
+
+def _owner_of_multicall(
+    w3: Web3, contract: Contract, checksum_wallet: str
+) -> Optional[Dict[str, Any]]:
+    """Resolve tokenIdOf + ownerOf in one Multicall3 round-trip.
+
+    ownerOf is called speculatively with ``uint256(uint160(wallet))``, the
+    TrustMintSBT token id derivation. Returns None when Multicall3 is missing
+    or the contract derives ids differently; callers then go sequential.
+    """
+    speculative_id = int(checksum_wallet, 16)
+    owner_contract = (
+        contract
+        if "ownerOf" in _contract_functions(contract)
+        else _fallback_contract(w3, contract.address, "ownerOf")
+    )
+    calls = [
+        (
+            contract.address,
+            encode_contract_call(owner_contract, "ownerOf", [speculative_id]),
+        )
+    ]
+    has_tid = "tokenIdOf" in _contract_functions(contract)
+    if has_tid:
+        calls.append(
+            (
+                contract.address,
+                encode_contract_call(contract, "tokenIdOf", [checksum_wallet]),
+            )
+        )
+    results = multicall3(w3, calls)
+    if results is None:
+        return None
+    token_id = speculative_id
+    owner_ok, owner_data = results[0]
+    try:
+        if has_tid:
+            tid_ok, tid_data = results[1]
+            if not tid_ok:
+                return None
+            token_id = int(w3.codec.decode(["uint256"], tid_data)[0])
+            if token_id != speculative_id:
+                return None
+        owner = (
+            Web3.to_checksum_address(w3.codec.decode(["address"], owner_data)[0])
+            if owner_ok
+            else None
+        )
+    except DecodingError:
+        return None  # empty/short return data; let the caller go sequential
+    return {"tokenId": token_id, "owner": owner, "reverted": not owner_ok}
+
 
 def _has_sbt(w3: Web3, contract: Contract, checksum_wallet: str) -> bool:
     try:
-        has_fn = getattr(contract.functions, "hasSbt", None)
-        if has_fn is not None:
-            return bool(has_fn(checksum_wallet).call())
+        if "hasSbt" in _contract_functions(contract):
+            (has,) = _view_call(
+                w3,
+                contract.address,
+                _SEL_HAS_SBT,
+                ("address",),
+                (checksum_wallet,),
+                ("bool",),
+            )
+            return bool(has)
     except Exception:
         pass
     try:
-        tid_fn = getattr(contract.functions, "tokenIdOf", None)
+        batched = _owner_of_multicall(w3, contract, checksum_wallet)
+        if batched is not None:
+            return batched["owner"] not in (None, _ZERO_ADDRESS)
+    except Exception:
+        pass
+    try:
+        tid_fn = _contract_fn(contract, "tokenIdOf")
         token_id = (
             int(tid_fn(checksum_wallet).call()) if tid_fn else int(checksum_wallet, 16)
         )
-        owner_fn = getattr(contract.functions, "ownerOf", None)
-        if owner_fn is None:
-            fb = w3.eth.contract(
-                address=contract.address,
-                abi=[
-                    {
-                        "name": "ownerOf",
-                        "type": "function",
-                        "stateMutability": "view",
-                        "inputs": [{"name": "tokenId", "type": "uint256"}],
-                        "outputs": [{"name": "", "type": "address"}],
-                    }
-                ],
-            )
-            owner = fb.functions.ownerOf(token_id).call()
-        else:
-            owner = owner_fn(token_id).call()
+        owner = _owner_of(w3, contract.address, token_id)
         return owner not in (None, _ZERO_ADDRESS)
     except Exception:
         return False
@@ -89,39 +274,52 @@ def build_llm_toolkit(
             return tool_error("Invalid wallet address supplied.")
         # Preferred
         try:
-            has_fn = getattr(contract.functions, "hasSbt", None)
-            if has_fn is not None:
-                has = bool(has_fn(checksum_wallet).call())
+            if "hasSbt" in _contract_functions(contract):
+                (has,) = _view_call(
+                    w3,
+                    contract.address,
+                    _SEL_HAS_SBT,
+                    ("address",),
+                    (checksum_wallet,),
+                    ("bool",),
+                )
+                has = bool(has)
                 return tool_success(
                     {"wallet": checksum_wallet, "hasSbt": has, "strategy": "hasSbt"}
                 )
         except (ContractLogicError, Web3Exception):
             pass
-        # Fallback via ownerOf(tokenId)
+        # Fallback via ownerOf(tokenId), batched through Multicall3 when possible
+        try:
+            batched = _owner_of_multicall(w3, contract, checksum_wallet)
+        except Exception:
+            batched = None
+        if batched is not None:
+            if batched["reverted"]:
+                return tool_success(
+                    {
+                        "wallet": checksum_wallet,
+                        "hasSbt": False,
+                        "strategy": "ownerOf_revert",
+                    }
+                )
+            return tool_success(
+                {
+                    "wallet": checksum_wallet,
+                    "hasSbt": batched["owner"] != _ZERO_ADDRESS,
+                    "strategy": "ownerOf_multicall",
+                    "tokenId": str(batched["tokenId"]),
+                    "owner": batched["owner"],
+                }
+            )
         try:
-            tid_fn = getattr(contract.functions, "tokenIdOf", None)
+            tid_fn = _contract_fn(contract, "tokenIdOf")
             tid = (
                 int(tid_fn(checksum_wallet).call())
                 if tid_fn
                 else int(checksum_wallet, 16)
             )
-            owner_of_fn = getattr(contract.functions, "ownerOf", None)
-            if owner_of_fn is None:
-                fb = w3.eth.contract(
-                    address=contract.address,
-                    abi=[
-                        {
-                            "name": "ownerOf",
-                            "type": "function",
-                            "stateMutability": "view",
-                            "inputs": [{"name": "tokenId", "type": "uint256"}],
-                            "outputs": [{"name": "", "type": "address"}],
-                        }
-                    ],
-                )
-                owner = fb.functions.ownerOf(tid).call()
-            else:
-                owner = owner_of_fn(tid).call()
+            owner = _owner_of(w3, contract.address, tid)
             has = owner not in (None, "0x0000000000000000000000000000000000000000")
             return tool_success(
                 {
@@ -168,9 +366,15 @@ def build_llm_toolkit(
             return tool_error("Invalid wallet address supplied.")
         # Preferred getScore
         try:
-            score_fn = getattr(contract.functions, "getScore", None)
-            if score_fn is not None:
-                value, timestamp, valid = score_fn(checksum_wallet).call()
+            if "getScore" in _contract_functions(contract):
+                value, timestamp, valid = _view_call(
+                    w3,
+                    contract.address,
+                    _SEL_GET_SCORE,
+                    ("address",),
+                    (checksum_wallet,),
+                    ("uint256", "uint256", "bool"),
+                )
                 return tool_success(
                     {
                         "wallet": checksum_wallet,
@@ -184,7 +388,7 @@ def build_llm_toolkit(
             pass
         # Fallback scores mapping
         try:
-            scores_fn = getattr(contract.functions, "scores", None)
+            scores_fn = _contract_fn(contract, "scores")
             if scores_fn is not None:
                 value, timestamp, valid = scores_fn(checksum_wallet).call()
                 return tool_success(
@@ -200,33 +404,7 @@ def build_llm_toolkit(
             pass
         # Minimal ABI fallback
         try:
-            fb = w3.eth.contract(
-                address=contract.address,
-                abi=[
-                    {
-                        "name": "getScore",
-                        "type": "function",
-                        "stateMutability": "view",
-                        "inputs": [{"name": "borrower", "type": "address"}],
-                        "outputs": [
-                            {"name": "value", "type": "uint256"},
-                            {"name": "timestamp", "type": "uint256"},
-                            {"name": "valid", "type": "bool"},
-                        ],
-                    },
-                    {
-                        "name": "scores",
-                        "type": "function",
-                        "stateMutability": "view",
-                        "inputs": [{"name": "", "type": "address"}],
-                        "outputs": [
-                            {"name": "value", "type": "uint256"},
-                            {"name": "timestamp", "type": "uint256"},
-                            {"name": "valid", "type": "bool"},
-                        ],
-                    },
-                ],
-            )
+            fb = _fallback_contract(w3, contract.address, "score")
             try:
                 value, timestamp, valid = fb.functions.getScore(checksum_wallet).call()
                 strategy = "fallback_getScore"
@@ -266,14 +444,54 @@ def build_llm_toolkit(
     )
 
     # ---- Writes ----
-    def _preflight_owner(owner_address: str) -> Optional[str]:
+    def _batched_preflight(
+        owner_address: str, wallet: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Fetch latest block, pending nonce, owner() and hasSbt() in one batch.
+
+        Returns an empty dict when the endpoint rejects batching; callers then
+        fall back to individual requests.
+        """
+        owner_fn = _contract_fn(contract, "owner")
+        has_fn = _contract_fn(contract, "hasSbt") if wallet else None
+        try:
+            with w3.batch_requests() as batch:
+                batch.add(w3.eth.get_block("latest"))
+                batch.add(w3.eth.get_transaction_count(owner_address, "pending"))
+                if owner_fn is not None:
+                    batch.add(owner_fn())
+                if has_fn is not None:
+                    batch.add(has_fn(wallet))
+                results = list(batch.execute())
+        except Exception:
+            return {}
+        preflight: Dict[str, Any] = {
+            "latest": results[0],
+            "pending_nonce": int(results[1]),
+        }
+        index = 2
+        if owner_fn is not None:
+            preflight["owner"] = results[index]
+            index += 1
+        if has_fn is not None:
+            preflight["hasSbt"] = bool(results[index])
+        return preflight
+
+    def _preflight_owner(
+        owner_address: str, chain_owner: Optional[str] = None
+    ) -> Optional[str]:
         """Return None if OK; otherwise error message."""
         try:
-            owner_fn = getattr(contract.functions, "owner", None)
-            if owner_fn is None:
-                return None
-            chain_owner = owner_fn().call()
-            if chain_owner.lower() != owner_address.lower():
+            if chain_owner is None:
+                if "owner" not in _contract_functions(contract):
+                    return None
+                (chain_owner,) = _view_call(
+                    w3, contract.address, _SEL_OWNER, (), (), ("address",)
+                )
+            # Both sides are usually checksummed already; skip lowercasing then.
+            if chain_owner != owner_address and (
+                chain_owner.lower() != owner_address.lower()
+            ):
                 return f"PRIVATE_KEY address {owner_address} is not the contract owner {chain_owner}."
             return None
         except Exception:
@@ -288,71 +506,68 @@ def build_llm_toolkit(
             checksum_wallet = Web3.to_checksum_address(wallet_address)
         except ValueError:
             return tool_error("Invalid wallet address supplied.")
+        try:
+            score_value = int(score_value)
+        except (TypeError, ValueError):
+            return tool_error("Score value must be an integer.")
         try:
             owner_acct = w3.eth.account.from_key(derived_private_key)
         except Exception as exc:
             return tool_error(f"Unable to derive signer from private key: {exc}")
+        preflight = _batched_preflight(owner_acct.address)
         # Owner check (when available)
-        msg = _preflight_owner(owner_acct.address)
+        msg = _preflight_owner(owner_acct.address, preflight.get("owner"))
         if msg:
             return tool_error(msg)
         try:
-            score_value = int(score_value)
-            fees = fee_params(w3, gas_price_gwei)
-            nonce = next_nonce(w3, owner_acct.address)
-            fn = getattr(contract.functions, "issueScore", None)
-            if fn is None:
-                fb = w3.eth.contract(
-                    address=contract.address,
-                    abi=[
-                        {
-                            "name": "issueScore",
-                            "type": "function",
-                            "stateMutability": "nonpayable",
-                            "inputs": [
-                                {"name": "borrower", "type": "address"},
-                                {"name": "value", "type": "uint256"},
-                            ],
-                            "outputs": [],
-                        }
-                    ],
+            fees = fee_params(w3, gas_price_gwei, preflight.get("latest"))
+            chain_id = chain_id_for(w3)
+            with signer_lock(w3, owner_acct.address):
+                nonce = next_nonce(
+                    w3, owner_acct.address, preflight.get("pending_nonce")
                 )
-                fn = fb.functions.issueScore
-            tx = fn(checksum_wallet, score_value).build_transaction(
-                {
+                params = {
                     "from": owner_acct.address,
                     "nonce": nonce,
                     "gas": default_gas_limit,
-                    "chainId": w3.eth.chain_id,
+                    "chainId": chain_id,
                     **fees,
                 }
-            )
-            sent = sign_and_send(w3, derived_private_key, tx)
-            if "error" in sent:
-                # Retry once with fee bump if underpriced
-                if sent.get("status") == "underpriced" or "underpriced" in sent.get(
-                    "error", ""
-                ):
-                    # bump fees ~15%
-                    if "maxFeePerGas" in fees:
-                        fees_bumped = {
-                            "maxFeePerGas": int(fees["maxFeePerGas"] * 1.15),
-                            "maxPriorityFeePerGas": int(
-                                fees["maxPriorityFeePerGas"] * 1.15
-                            ),
-                        }
-                    else:
-                        fees_bumped = {"gasPrice": int(fees["gasPrice"] * 1.15)}
-                    tx["nonce"] = nonce  # same nonce to replace
-                    for k, v in fees_bumped.items():
-                        tx[k] = v
-                    sent = sign_and_send(w3, derived_private_key, tx)
+                try:
+                    fn = _contract_fn(contract, "issueScore")
+                    if fn is None:
+                        fb = _fallback_contract(w3, contract.address, "issueScore")
+                        fn = fb.functions.issueScore
+                    tx = fn(checksum_wallet, score_value).build_transaction(params)
+                except Exception:
+                    release_nonce(w3, params)  # never broadcast; do not leave a gap
+                    raise
+                sent = sign_and_send(w3, derived_private_key, tx)
                 if "error" in sent:
-                    return (
-                        tool_error(sent["error"])
-                        if isinstance(sent["error"], str)
-                        else tool_error(str(sent["error"]))
-                    )
+                    # Retry once with fee bump if underpriced
+                    if sent.get("status") == "underpriced" or "underpriced" in sent.get(
+                        "error", ""
+                    ):
+                        # bump fees ~15%
+                        if "maxFeePerGas" in fees:
+                            fees_bumped = {
+                                "maxFeePerGas": int(fees["maxFeePerGas"] * 1.15),
+                                "maxPriorityFeePerGas": int(
+                                    fees["maxPriorityFeePerGas"] * 1.15
+                                ),
+                            }
+                        else:
+                            fees_bumped = {"gasPrice": int(fees["gasPrice"] * 1.15)}
+                        tx["nonce"] = nonce  # same nonce to replace
+                        for k, v in fees_bumped.items():
+                            tx[k] = v
+                        sent = sign_and_send(w3, derived_private_key, tx)
+                    if "error" in sent:
+                        return (
+                            tool_error(sent["error"])
+                            if isinstance(sent["error"], str)
+                            else tool_error(str(sent["error"]))
+                        )
             return tool_success(sent)
         except ContractLogicError as exc:
             return tool_error(f"Contract rejected the transaction: {exc}")
@@ -394,67 +609,67 @@ def build_llm_toolkit(
             owner_acct = w3.eth.account.from_key(derived_private_key)
         except Exception as exc:
             return tool_error(f"Unable to derive signer from private key: {exc}")
+        preflight = _batched_preflight(owner_acct.address, checksum_wallet)
         # Owner check (when available)
-        msg = _preflight_owner(owner_acct.address)
+        msg = _preflight_owner(owner_acct.address, preflight.get("owner"))
         if msg:
             return tool_error(msg)
         # Preflight: ensure SBT is minted to avoid revert
-        if not _has_sbt(w3, contract, checksum_wallet):
+        has_sbt = preflight.get("hasSbt")
+        if has_sbt is None:
+            has_sbt = _has_sbt(w3, contract, checksum_wallet)
+        if not has_sbt:
             return tool_error(
                 "SBT not minted for this wallet; revokeScore would revert."
             )
         try:
-            fees = fee_params(w3, gas_price_gwei)
-            nonce = next_nonce(w3, owner_acct.address)
-            fn = getattr(contract.functions, "revokeScore", None)
-            if fn is None:
-                fb = w3.eth.contract(
-                    address=contract.address,
-                    abi=[
-                        {
-                            "name": "revokeScore",
-                            "type": "function",
-                            "stateMutability": "nonpayable",
-                            "inputs": [{"name": "borrower", "type": "address"}],
-                            "outputs": [],
-                        }
-                    ],
+            fees = fee_params(w3, gas_price_gwei, preflight.get("latest"))
+            chain_id = chain_id_for(w3)
+            with signer_lock(w3, owner_acct.address):
+                nonce = next_nonce(
+                    w3, owner_acct.address, preflight.get("pending_nonce")
                 )
-                fn = fb.functions.revokeScore
-            tx = fn(checksum_wallet).build_transaction(
-                {
+                params = {
                     "from": owner_acct.address,
                     "nonce": nonce,
                     "gas": default_gas_limit,
-                    "chainId": w3.eth.chain_id,
+                    "chainId": chain_id,
                     **fees,
                 }
-            )
-            sent = sign_and_send(w3, derived_private_key, tx)
-            if "error" in sent:
-                # Retry once with fee bump if underpriced
-                if sent.get("status") == "underpriced" or "underpriced" in sent.get(
-                    "error", ""
-                ):
-                    if "maxFeePerGas" in fees:
-                        fees_bumped = {
-                            "maxFeePerGas": int(fees["maxFeePerGas"] * 1.15),
-                            "maxPriorityFeePerGas": int(
-                                fees["maxPriorityFeePerGas"] * 1.15
-                            ),
-                        }
-                    else:
-                        fees_bumped = {"gasPrice": int(fees["gasPrice"] * 1.15)}
-                    tx["nonce"] = nonce
-                    for k, v in fees_bumped.items():
-                        tx[k] = v
-                    sent = sign_and_send(w3, derived_private_key, tx)
+                try:
+                    fn = _contract_fn(contract, "revokeScore")
+                    if fn is None:
+                        fb = _fallback_contract(w3, contract.address, "revokeScore")
+                        fn = fb.functions.revokeScore
+                    tx = fn(checksum_wallet).build_transaction(params)
+                except Exception:
+                    release_nonce(w3, params)  # never broadcast; do not leave a gap
+                    raise
+                sent = sign_and_send(w3, derived_private_key, tx)
                 if "error" in sent:
-                    return (
-                        tool_error(sent["error"])
-                        if isinstance(sent["error"], str)
-                        else tool_error(str(sent["error"]))
-                    )
+                    # Retry once with fee bump if underpriced
+                    if sent.get("status") == "underpriced" or "underpriced" in sent.get(
+                        "error", ""
+                    ):
+                        if "maxFeePerGas" in fees:
+                            fees_bumped = {
+                                "maxFeePerGas": int(fees["maxFeePerGas"] * 1.15),
+                                "maxPriorityFeePerGas": int(
+                                    fees["maxPriorityFeePerGas"] * 1.15
+                                ),
+                            }
+                        else:
+                            fees_bumped = {"gasPrice": int(fees["gasPrice"] * 1.15)}
+                        tx["nonce"] = nonce
+                        for k, v in fees_bumped.items():
+                            tx[k] = v
+                        sent = sign_and_send(w3, derived_private_key, tx)
+                    if "error" in sent:
+                        return (
+                            tool_error(sent["error"])
+                            if isinstance(sent["error"], str)
+                            else tool_error(str(sent["error"]))
+                        )
             return tool_success(sent)
         except ContractLogicError as exc:
             return tool_error(f"Contract rejected the transaction: {exc}")
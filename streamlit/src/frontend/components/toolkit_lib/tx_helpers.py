@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Union
 
+from eth_account.signers.local import LocalAccount
 from web3 import Web3
 from web3.contract import Contract
-from web3.exceptions import Web3Exception
+from web3.exceptions import TransactionNotFound, Web3Exception
 
 import streamlit as st
 
@@ -37,89 +43,430 @@ _CUSTOM_ERROR_MAP: Dict[str, Tuple[str, Tuple[str, ...]]] = {
 }
 
 
-def supports_eip1559(w3: Web3) -> bool:
+_LATEST_BLOCK_KEY = "_latest_block_cache"
+
+
+def _endpoint_key(w3: Web3) -> str:
+    return getattr(w3.provider, "endpoint_uri", None) or str(id(w3))
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _chain_meta(endpoint: str, _w3: Web3) -> Dict[str, Any]:
+    """Chain-level facts per RPC endpoint, shared across reruns and clients.
+
+    Raises on RPC failure so that an outage is not cached.
+    """
+    latest = _w3.eth.get_block("latest")
+    return {
+        "chain_id": int(_w3.eth.chain_id),
+        "supports_1559": latest.get("baseFeePerGas") is not None,
+    }
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _block_time_hint(endpoint: str, _w3: Web3) -> Optional[float]:
+    """Average block time over the last 10 blocks; only needed to poll receipts."""
+    latest = _w3.eth.get_block("latest")
+    number = int(latest["number"])
+    if number <= 10:
+        return None
+    earlier = _w3.eth.get_block(number - 10)
+    return (int(latest["timestamp"]) - int(earlier["timestamp"])) / 10
+
+
+def chain_meta(w3: Web3) -> Optional[Dict[str, Any]]:
     try:
-        latest = w3.eth.get_block("latest")
+        return _chain_meta(_endpoint_key(w3), w3)
+    except Exception:
+        return None
+
+
+def chain_id_for(w3: Web3) -> int:
+    """Chain ID of ``w3``'s endpoint; fixed for the lifetime of the chain."""
+    meta = chain_meta(w3)
+    if meta is not None:
+        return meta["chain_id"]
+    return int(w3.eth.chain_id)
+
+
+def latest_block(w3: Web3, ttl: float = 2.0) -> Any:
+    """Latest block, memoized per endpoint in the session for ``ttl`` seconds."""
+    cache = st.session_state.setdefault(_LATEST_BLOCK_KEY, {})
+    key = _endpoint_key(w3)
+    entry = cache.get(key)
+    now = time.monotonic()
+    if entry is not None and now - entry[0] < ttl:
+        return entry[1]
+    block = w3.eth.get_block("latest")
+    cache[key] = (now, block)
+    return block
+
+
+def supports_eip1559(w3: Web3, latest: Optional[Any] = None) -> bool:
+    meta = chain_meta(w3)
+    if meta is not None:
+        return meta["supports_1559"]
+    try:
+        if latest is None:
+            latest = latest_block(w3)
         return "baseFeePerGas" in latest and latest["baseFeePerGas"] is not None
     except Exception:
         return False
 
 
-def fee_params(w3: Web3, gas_price_gwei: str) -> Dict[str, int]:
+@lru_cache(maxsize=1)
+def _fee_overrides() -> Tuple[int, Optional[int]]:
+    """(priority fee, max fee override) in wei.
+
+    Read on first use rather than at import: app.py loads .env after the
+    components package is imported.
+    """
+    prio = Web3.to_wei(int(os.getenv("ARC_PRIORITY_FEE_GWEI", "1")), "gwei")
+    max_gwei = os.getenv("ARC_MAX_FEE_GWEI")
+    max_fee: Optional[int] = None
+    if max_gwei:
+        try:
+            max_fee = Web3.to_wei(int(max_gwei), "gwei")
+        except Exception:
+            pass
+    return prio, max_fee
+
+
+def fee_params(
+    w3: Web3, gas_price_gwei: str, latest: Optional[Any] = None
+) -> Dict[str, int]:
     """Return fee params for tx: EIP-1559 when supported; otherwise legacy gasPrice.
     Env overrides (optional): ARC_PRIORITY_FEE_GWEI, ARC_MAX_FEE_GWEI
+    Pass ``latest`` when the caller already fetched the latest block.
     """
-    if supports_eip1559(w3):
+    if latest is None:
         try:
-            latest = w3.eth.get_block("latest")
-            base = int(latest["baseFeePerGas"])  # wei
+            latest = latest_block(w3)
         except Exception:
-            base = Web3.to_wei(int(gas_price_gwei), "gwei") // 2
-        prio_gwei = int(os.getenv("ARC_PRIORITY_FEE_GWEI", "1"))
-        max_gwei = os.getenv("ARC_MAX_FEE_GWEI")
-        prio = Web3.to_wei(prio_gwei, "gwei")
-        max_fee = base * 2 + prio
-        if max_gwei:
-            try:
-                max_fee = Web3.to_wei(int(max_gwei), "gwei")
-            except Exception:
-                pass
+            latest = None
+    if latest is not None and supports_eip1559(w3, latest):
+        base = int(latest["baseFeePerGas"])  # wei
+    elif latest is None and supports_eip1559(w3):
+        # Block fetch failed on a 1559 chain: derive a base fee, stay type-2.
+        base = Web3.to_wei(int(gas_price_gwei), "gwei") // 2
+    else:
+        base = None
+    if base is not None:
+        prio, max_fee_override = _fee_overrides()
+        max_fee = base * 2 + prio if max_fee_override is None else max_fee_override
         return {"maxFeePerGas": max_fee, "maxPriorityFeePerGas": prio}
     return {"gasPrice": Web3.to_wei(int(gas_price_gwei), "gwei")}
 
 
-def next_nonce(w3: Web3, addr: str) -> int:
-    """Pending nonce + session monotonic bump to avoid duplicates on fast clicks."""
+@lru_cache(maxsize=64)
+def _address_key(addr: str) -> str:
+    return addr.lower()
+
+
+_NONCE_TTL = 30.0  # seconds before the local count is re-read from the chain
+
+
+def _nonce_key(w3: Web3, addr: str) -> Tuple[str, str]:
+    # The same key may sign on several endpoints/chains; never share a count.
+    return _endpoint_key(w3), _address_key(addr)
+
+
+class NonceManager:
+    """Process-wide local nonce counter, seeded from the pending count once.
+
+    Later nonces are handed out locally; ``release`` rewinds a nonce that was
+    never broadcast and ``invalidate`` forces a re-seed from the chain, as does
+    a counter older than ``ttl`` seconds. It is shared by every session (and
+    tool worker thread) signing with the same key, so updates are locked. Counters are per (endpoint, address).
+    """
+
+    def __init__(self, ttl: float = _NONCE_TTL) -> None:
+        self._next: Dict[Tuple[str, str], int] = {}
+        self._seeded_at: Dict[Tuple[str, str], float] = {}
+        self._ttl = ttl
+        self._lock = threading.Lock()
+
+    def reserve(self, w3: Web3, addr: str, pending: Optional[int] = None) -> int:
+        key = _nonce_key(w3, addr)
+        with self._lock:
+            nonce = self._next.get(key)
+            now = time.monotonic()
+            if nonce is None or now - self._seeded_at.get(key, 0.0) > self._ttl:
+                # Unseeded or stale: the chain's pending count is authoritative
+                # and closes any gap left by a tx that never made it.
+                nonce = pending if pending is not None else _pending_count(w3, addr)
+                self._seeded_at[key] = now
+            elif pending is not None:
+                # A pending count fetched anyway (e.g. in a preflight batch) is
+                # free to reconcile against; it catches txs from other clients.
+                nonce = max(nonce, pending)
+            self._next[key] = nonce + 1
+            return nonce
+
+    def is_seeded(self, w3: Web3, addr: str) -> bool:
+        key = _nonce_key(w3, addr)
+        with self._lock:
+            if key not in self._next:
+                return False
+            return time.monotonic() - self._seeded_at.get(key, 0.0) <= self._ttl
+
+    def release(self, w3: Web3, addr: str, nonce: int) -> None:
+        key = _nonce_key(w3, addr)
+        with self._lock:
+            if self._next.get(key) == nonce + 1:
+                self._next[key] = nonce
+            else:
+                # Not the latest reservation; rewinding would skip the later
+                # one, so re-seed from the chain instead of leaving a gap.
+                self._next.pop(key, None)
+
+    def invalidate(self, w3: Web3, addr: str) -> None:
+        with self._lock:
+            self._next.pop(_nonce_key(w3, addr), None)
+
+
+_NONCE_MANAGER = NonceManager()
+
+_SIGNER_LOCKS: Dict[Tuple[str, str], threading.RLock] = {}
+_SIGNER_LOCKS_GUARD = threading.Lock()
+
+
+def signer_lock(w3: Web3, addr: str) -> threading.RLock:
+    """Lock to hold from nonce reservation through broadcast for ``addr``.
+
+    Tool threads from every session share it, so transactions from one key
+    reach the node in nonce order instead of racing each other.
+    """
+    key = _nonce_key(w3, addr)
+    with _SIGNER_LOCKS_GUARD:
+        lock = _SIGNER_LOCKS.get(key)
+        if lock is None:
+            lock = _SIGNER_LOCKS[key] = threading.RLock()
+        return lock
+
+
+def _pending_count(w3: Web3, addr: str) -> int:
+    try:
+        return w3.eth.get_transaction_count(addr, "pending")
+    except Exception:
+        return w3.eth.get_transaction_count(addr)
+
+
+def nonce_manager() -> NonceManager:
+    return _NONCE_MANAGER
+
+
+def next_nonce(w3: Web3, addr: str, pending: Optional[int] = None) -> int:
+    """Next nonce for ``addr`` from the shared NonceManager.
+    Pass ``pending`` when the pending transaction count was already fetched.
+    """
+    return nonce_manager().reserve(w3, addr, pending)
+
+
+def release_nonce(w3: Web3, tx: Dict[str, Any]) -> None:
+    """Hand back the nonce of a tx that failed before it was broadcast."""
+    sender = tx.get("from")
+    nonce = tx.get("nonce")
+    if sender and isinstance(nonce, int):
+        nonce_manager().release(w3, sender, nonce)
+
+
+@lru_cache(maxsize=1)
+def _receipt_poll_override() -> Optional[float]:
+    raw = os.getenv("ARC_RECEIPT_POLL_S")
+    if not raw:
+        return None
     try:
-        pending = w3.eth.get_transaction_count(addr, "pending")
+        return max(float(raw), 0.05)
+    except ValueError:
+        return None
+
+
+def _receipt_poll_latency(w3: Web3) -> float:
+    """Seconds between receipt polls: ARC_RECEIPT_POLL_S, else half a block."""
+    override = _receipt_poll_override()
+    if override is not None:
+        return override
+    try:
+        hint = _block_time_hint(_endpoint_key(w3), w3)
     except Exception:
-        pending = w3.eth.get_transaction_count(addr)
-    key = f"_nonce_{addr.lower()}"
-    last = st.session_state.get(key)
-    if isinstance(last, int) and pending <= last:
-        pending = last + 1
-    st.session_state[key] = pending
-    return pending
+        hint = None
+    if not hint:
+        return 0.5
+    return min(max(hint / 2, 0.1), 2.0)
+
 
+def _broadcast(
+    w3: Web3,
+    private_key: Union[str, LocalAccount],
+    tx: Dict[str, Any],
+    retry_on_nonce_error: bool = True,
+) -> Tuple[Dict[str, Any], Any, Optional[Dict[str, Any]]]:
+    """Sign and submit ``tx``.
 
-def sign_and_send(w3: Web3, private_key: str, tx: Dict[str, Any]) -> Dict[str, Any]:
+    Returns ``(sent_tx, tx_hash, None)`` once the node accepted the tx, or
+    ``(tx, None, payload)`` when there is no receipt to wait for.
+    """
     try:
-        signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
-        raw_tx = getattr(signed, "rawTransaction", None) or getattr(
-            signed, "raw_transaction", None
+        if isinstance(private_key, LocalAccount):
+            # Pre-loaded account: skips decoding the key on every signature.
+            signed = private_key.sign_transaction(tx)
+        else:
+            signed = w3.eth.account.sign_transaction(tx, private_key=private_key)
+    except Exception:
+        release_nonce(w3, tx)
+        raise
+    raw_tx = getattr(signed, "rawTransaction", None) or getattr(
+        signed, "raw_transaction", None
+    )
+    if raw_tx is None:
+        release_nonce(w3, tx)
+        return (
+            tx,
+            None,
+            {"error": "Signed transaction missing rawTransaction/raw_transaction"},
         )
-        if raw_tx is None:
-            return {
-                "error": "Signed transaction missing rawTransaction/raw_transaction"
-            }
-        local_hash = Web3.keccak(raw_tx).hex()
-        try:
-            tx_hash = w3.eth.send_raw_transaction(raw_tx)
-            receipt = w3.eth.wait_for_transaction_receipt(tx_hash)
-            formatted = format_receipt(receipt)
-            status = formatted.get("status")
-            if status in (1, True):
-                return {"txHash": tx_hash.hex(), "receipt": formatted}
-            error_payload: Dict[str, Any] = {
-                "error": "Transaction reverted",
-                "txHash": tx_hash.hex(),
-                "receipt": formatted,
-            }
-            revert_reason = _extract_revert_reason(w3, tx, receipt)
-            if revert_reason:
-                error_payload["reason"] = revert_reason
-            return error_payload
-        except Web3Exception as exc:
-            text = str(exc)
+    try:
+        return tx, w3.eth.send_raw_transaction(raw_tx), None
+    except Exception as exc:
+        text = str(exc)
+        if _on_send_failure(w3, tx, text) and retry_on_nonce_error:
+            # Local counter was out of step; re-seed and retry once.
+            retry_tx = {**tx, "nonce": next_nonce(w3, tx["from"])}
+            return _broadcast(w3, private_key, retry_tx, retry_on_nonce_error=False)
+        if isinstance(exc, Web3Exception):
+            local_hash = Web3.keccak(raw_tx).hex()
             if "already known" in text:
-                return {"txHash": local_hash, "status": "already_known"}
+                return tx, None, {"txHash": local_hash, "status": "already_known"}
             if "replacement transaction underpriced" in text:
-                return {"txHash": local_hash, "status": "underpriced"}
-            raise
+                return tx, None, {"txHash": local_hash, "status": "underpriced"}
+        raise
+
+
+def _await_receipt(
+    w3: Web3, tx: Dict[str, Any], tx_hash: Any, poll_latency: float
+) -> Dict[str, Any]:
+    try:
+        receipt = w3.eth.wait_for_transaction_receipt(
+            tx_hash, poll_latency=poll_latency
+        )
+    except Exception:
+        # e.g. TimeExhausted: the tx may have been dropped, leaving a gap that
+        # would queue every later nonce; re-seed from the pending count.
+        if tx.get("from"):
+            nonce_manager().invalidate(w3, tx["from"])
+        raise
+    formatted = format_receipt(receipt)
+    status = formatted.get("status")
+    if status in (1, True):
+        return {"txHash": tx_hash.hex(), "receipt": formatted}
+    error_payload: Dict[str, Any] = {
+        "error": "Transaction reverted",
+        "txHash": tx_hash.hex(),
+        "receipt": formatted,
+    }
+    revert_reason = _extract_revert_reason(w3, tx, receipt)
+    if revert_reason:
+        error_payload["reason"] = revert_reason
+    return error_payload
+
+
+def sign_and_send(
+    w3: Web3,
+    private_key: Union[str, LocalAccount],
+    tx: Dict[str, Any],
+    retry_on_nonce_error: bool = True,
+) -> Dict[str, Any]:
+    try:
+        sent_tx, tx_hash, payload = _broadcast(
+            w3, private_key, tx, retry_on_nonce_error
+        )
+        if payload is not None:
+            return payload
+        return _await_receipt(w3, sent_tx, tx_hash, _receipt_poll_latency(w3))
     except Exception as exc:
         return {"error": f"sign/send error: {exc}"}
 
 
+_RECEIPT_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="receipt")
+_PENDING_RECEIPTS: "OrderedDict[str, Future[Dict[str, Any]]]" = OrderedDict()
+_PENDING_RECEIPTS_LIMIT = 256
+_PENDING_RECEIPTS_LOCK = threading.Lock()
+
+
+def _hash_key(tx_hash: str) -> str:
+    text = tx_hash.lower()
+    return text[2:] if text.startswith("0x") else text
+
+
+def sign_and_broadcast(
+    w3: Web3, private_key: Union[str, LocalAccount], tx: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Like sign_and_send, but return as soon as the node accepts the tx.
+
+    The receipt is awaited on a background thread; poll it with tx_status.
+    """
+    try:
+        sent_tx, tx_hash, payload = _broadcast(w3, private_key, tx)
+    except Exception as exc:
+        return {"error": f"sign/send error: {exc}"}
+    if payload is not None:
+        return payload
+    # Resolved here: chain_meta needs the script run context.
+    poll_latency = _receipt_poll_latency(w3)
+    future = _RECEIPT_POOL.submit(_await_receipt, w3, sent_tx, tx_hash, poll_latency)
+    with _PENDING_RECEIPTS_LOCK:
+        _PENDING_RECEIPTS[_hash_key(tx_hash.hex())] = future
+        while len(_PENDING_RECEIPTS) > _PENDING_RECEIPTS_LIMIT:
+            _PENDING_RECEIPTS.popitem(last=False)
+    return {"txHash": tx_hash.hex(), "status": "pending"}
+
+
+def tx_status(w3: Web3, tx_hash: str) -> Dict[str, Any]:
+    """Receipt payload for a broadcast tx, or ``status: pending``."""
+    with _PENDING_RECEIPTS_LOCK:
+        future = _PENDING_RECEIPTS.get(_hash_key(tx_hash))
+    if future is not None:
+        if not future.done():
+            return {"txHash": tx_hash, "status": "pending"}
+        if future.exception() is None:
+            return future.result()
+        # e.g. TimeExhausted on a slow tx; it may still be mined, so forget
+        # the failed wait and ask the node from now on.
+        with _PENDING_RECEIPTS_LOCK:
+            if _PENDING_RECEIPTS.get(_hash_key(tx_hash)) is future:
+                del _PENDING_RECEIPTS[_hash_key(tx_hash)]
+    # Not sent from this process, evicted, or the wait failed; ask the node.
+    try:
+        receipt = w3.eth.get_transaction_receipt(tx_hash)  # type: ignore[arg-type]
+    except TransactionNotFound:
+        return {"txHash": tx_hash, "status": "pending"}
+    except Exception as exc:
+        return {"txHash": tx_hash, "error": f"receipt error: {exc}"}
+    formatted = format_receipt(receipt)
+    if formatted.get("status") in (1, True):
+        return {"txHash": tx_hash, "receipt": formatted}
+    return {"error": "Transaction reverted", "txHash": tx_hash, "receipt": formatted}
+
+
+def _on_send_failure(w3: Web3, tx: Dict[str, Any], text: str) -> bool:
+    """Keep the local nonce counter in step after a rejected broadcast.
+
+    Returns True when the rejection was a nonce error worth one retry. The
+    counter is always dropped so the next reservation re-seeds from the chain.
+    """
+    sender = tx.get("from")
+    nonce = tx.get("nonce")
+    if not sender or not isinstance(nonce, int):
+        return False
+    if "already known" in text or "underpriced" in text:
+        return False  # nonce is taken by a transaction in the pool
+    # The node may or may not have kept the tx; re-seed rather than guess.
+    nonce_manager().invalidate(w3, sender)
+    # too low/high, invalid, gapped...: worth one retry on a fresh count.
+    return "nonce" in text.lower()
+
+
 def format_receipt(receipt: Any) -> dict[str, Any]:
     if receipt is None:
         return {"status": "pending"}
@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
-import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional, Sequence
 
+import orjson
+import requests
+from eth_abi import encode as abi_encode
+from requests.adapters import HTTPAdapter
 from web3 import Web3
 from web3.contract import Contract
 
 
+@lru_cache(maxsize=8)
+def _rpc_session(rpc_url: str) -> requests.Session:
+    """Return a keep-alive HTTP session shared by every client for ``rpc_url``."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 def get_web3_client(rpc_url: Optional[str]) -> Optional[Web3]:
     """Create a Web3 client if an RPC URL is provided and reachable.
 
@@ -18,7 +32,7 @@ def get_web3_client(rpc_url: Optional[str]) -> Optional[Web3]:
     if not rpc_url:
         return None
     try:
-        w3 = Web3(Web3.HTTPProvider(rpc_url))
+        w3 = Web3(Web3.HTTPProvider(rpc_url, session=_rpc_session(rpc_url)))
         # Optional ping; if provider is down this may raise
         _ = w3.eth.chain_id  # noqa: F841
         return w3
@@ -52,11 +66,11 @@ def load_contract_abi(abi_path: Optional[str]) -> Optional[list[dict[str, Any]]]
         if not p.is_file():
             raise ValueError(f"Path is not a file: {p}")
 
-        text = p.read_text(encoding="utf-8")
-        if not text.strip():
+        raw = p.read_bytes()
+        if not raw.strip():
             raise ValueError(f"ABI file is empty: {p}")
 
-        data = json.loads(text)
+        data = orjson.loads(raw)
         # Some artifact JSONs wrap the ABI under an "abi" key
         if isinstance(data, dict) and "abi" in data and isinstance(data["abi"], list):
             return data["abi"]  # type: ignore[return-value]
@@ -68,18 +82,60 @@ def load_contract_abi(abi_path: Optional[str]) -> Optional[list[dict[str, Any]]]
     except FileNotFoundError:
         # Re-raise file not found with better context
         raise
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"ABI file is not valid JSON: {p} - {e}")
     except Exception as e:
         raise ValueError(f"Failed to load ABI from {p}: {e}")
 
 
+_METHOD_CACHE_SIZE = 256
+_METHOD_CACHE: dict[
+    tuple[str, str, int], tuple[Any, Optional[tuple[bytes, tuple[str, ...]]]]
+] = {}
+
+
+def _method_signature(
+    contract: Contract, fn_name: str
+) -> Optional[tuple[bytes, tuple[str, ...]]]:
+    """Selector and input types for ``fn_name``; None if overloaded or tuple-typed."""
+    abi = contract.abi
+    # The same address may be bound to several ABIs; the entry keeps its ABI
+    # alive so the id cannot be recycled for a different one.
+    key = (contract.address, fn_name, id(abi))
+    cached = _METHOD_CACHE.get(key)
+    if cached is not None and cached[0] is abi:
+        return cached[1]
+    entries = [
+        entry
+        for entry in abi or ()
+        if entry.get("type") == "function" and entry.get("name") == fn_name
+    ]
+    signature = None
+    if len(entries) == 1:
+        types = tuple(inp["type"] for inp in entries[0].get("inputs", []))
+        if not any(t.startswith("tuple") for t in types):
+            selector = bytes(Web3.keccak(text=f"{fn_name}({','.join(types)})")[:4])
+            signature = (selector, types)
+    if len(_METHOD_CACHE) >= _METHOD_CACHE_SIZE:
+        _METHOD_CACHE.clear()
+    _METHOD_CACHE[key] = (abi, signature)
+    return signature
+
+
 def encode_contract_call(
     contract: Contract, fn_name: str, args: Sequence[Any] | None = None
 ) -> str:
     """Encode a contract function call, compatible with Web3.py v5/v6."""
     call_args = list(args or [])
 
+    signature = _method_signature(contract, fn_name)
+    if signature is not None:
+        selector, types = signature
+        try:
+            return "0x" + (selector + abi_encode(types, call_args)).hex()
+        except Exception:
+            pass  # e.g. non-checksummed address; let web3 normalize it
+
     def _try_encode(method_name: str) -> Optional[str]:
         encode_fn = getattr(contract, method_name, None)
         if not callable(encode_fn):